@@ -0,0 +1,2 @@
+# Liegt im Projektwurzelverzeichnis, damit pytest es in den Importpfad
+# aufnimmt und die Tests das Paket `src` importieren können.
@@ -0,0 +1,928 @@
+# src/rail_stores.py
+
+import pickle
+from functools import cached_property
+from typing import Any, Callable, Dict, List, NamedTuple, Sequence, Tuple, TypeVar
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba ist optional; ohne JIT laufen die Kerne als reiner NumPy-Code.
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda funktion: funktion
+
+from .rail_types import KEIN_ZUG, Fahrstrasse, Gleisabschnitt, IdRegistry, Knotenpunkt, KnotenTyp, OrtTyp, Zug, ZugStatus
+
+# --------------------------------------------------------------------------
+# ## SPALTENSPEICHER (Structure-of-Arrays)
+#
+# Die Dataclasses in `rail_types.py` beschreiben das Netz beim Laden.
+# Für die Simulation werden sie hier in zusammenhängende NumPy-Arrays
+# umgepackt: eine Spalte pro Eigenschaft, ein Index pro Objekt. Statt
+# Zeigern auf einzelne Python-Objekte (mit geboxten Floats) zu folgen,
+# laufen Abfragen und Summen über dichte Speicherblöcke.
+#
+# Alle Gleitkomma-Spalten (Längen, Geschwindigkeiten, Koordinaten) sind
+# float32: für Meter und m/s genügt die Genauigkeit, und es passen doppelt so
+# viele Werte in dieselbe Cache-Zeile bzw. dasselbe SIMD-Register. Summen
+# werden in float64 gebildet.
+#
+# Die Handles aus der jeweiligen `IdRegistry` sind zugleich die Zeilenindizes:
+# Knoten mit `knoten_id == 7` steht in Zeile 7 des `KnotenStore`.
+# --------------------------------------------------------------------------
+
+T = TypeVar('T')
+
+
+def _nach_handle(objekte: Sequence[T], handle: Callable[[T], int], ids: IdRegistry) -> List[T]:
+    """
+    Ordnet die Objekte nach ihrem Handle, sodass Handle und Zeilenindex
+    übereinstimmen. Jedes Handle der Registry muss genau einmal vorkommen.
+    """
+    geordnet: List = [None] * len(ids)
+    for objekt in objekte:
+        h = handle(objekt)
+        if not 0 <= h < len(ids) or geordnet[h] is not None:
+            raise ValueError(f"Ungültige oder doppelte ID {h}.")
+        geordnet[h] = objekt
+    if len(objekte) != len(ids):
+        raise ValueError("Jede ID der Registry muss genau einem Objekt zugeordnet sein.")
+    return geordnet
+
+
+def _csr(listen: Sequence[Sequence[int]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Packt eine Liste von Index-Listen in das CSR-Format (compressed sparse row):
+    die Einträge von Zeile `i` liegen in `indices[indptr[i]:indptr[i + 1]]`.
+    """
+    indptr = np.zeros(len(listen) + 1, dtype=np.int32)
+    np.cumsum([len(liste) for liste in listen], out=indptr[1:])
+    indices = np.fromiter((i for liste in listen for i in liste), dtype=np.int32, count=int(indptr[-1]))
+    return indptr, indices
+
+
+def _anzahl_worte(anzahl_bits: int) -> int:
+    """Die Anzahl der 64-Bit-Worte, die für eine Bitmaske mit `anzahl_bits` Bits nötig sind."""
+    return max(1, (anzahl_bits + 63) // 64)
+
+
+def _bit(idx: int) -> np.uint64:
+    """Das Bit von Index `idx` innerhalb seines 64-Bit-Wortes."""
+    # Über einen Python-int in uint64 rechnen: bei NumPy-Indizes (z.B. `int32`
+    # aus den Spalten der Speicher) würde `1 << idx` sonst im kleinen Typ überlaufen.
+    return np.uint64(1) << np.uint64(int(idx) & 63)
+
+
+def _bits_setzen(maske: np.ndarray, zeilen: np.ndarray, bits: np.ndarray) -> None:
+    """Setzt in der Bitmaskenmatrix `maske` für jedes Paar (zeile, bit) das entsprechende Bit."""
+    bits = np.asarray(bits).astype(np.uint64)
+    np.bitwise_or.at(maske, (zeilen, bits >> np.uint64(6)), np.left_shift(np.uint64(1), bits & np.uint64(63)))
+
+
+def _nach_zeilen(zeilen: np.ndarray, werte: np.ndarray, anzahl_zeilen: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gruppiert `werte` nach der zugehörigen Zeile in das CSR-Format, z.B. die
+    Zielknoten aller Fahrstraßen nach ihrem Startknoten.
+    """
+    reihenfolge = np.argsort(zeilen, kind='stable')
+    indptr = np.zeros(anzahl_zeilen + 1, dtype=np.int32)
+    np.cumsum(np.bincount(zeilen, minlength=anzahl_zeilen), out=indptr[1:])
+    return indptr, np.asarray(werte)[reihenfolge].astype(np.int32)
+
+
+def _starke_komponenten(indptr: np.ndarray, ziele: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Bestimmt die stark zusammenhängenden Komponenten eines gerichteten Graphen
+    in CSR-Form (Tarjan, iterativ). Die Komponenten sind in umgekehrt
+    topologischer Reihenfolge nummeriert: jede Komponente erreicht nur
+    Komponenten mit kleinerer Nummer.
+    """
+    indptr = indptr.tolist()
+    ziele = ziele.tolist()
+    anzahl = len(indptr) - 1
+    index = [-1] * anzahl
+    tiefster = [0] * anzahl
+    auf_stapel = [False] * anzahl
+    komponente = [-1] * anzahl
+    stapel: List[int] = []
+    zaehler = 0
+    anzahl_komponenten = 0
+
+    for start in range(anzahl):
+        if index[start] >= 0:
+            continue
+        index[start] = tiefster[start] = zaehler
+        zaehler += 1
+        stapel.append(start)
+        auf_stapel[start] = True
+        aufrufe = [(start, indptr[start])]
+        while aufrufe:
+            u, kante = aufrufe[-1]
+            if kante < indptr[u + 1]:
+                aufrufe[-1] = (u, kante + 1)
+                v = ziele[kante]
+                if index[v] < 0:
+                    index[v] = tiefster[v] = zaehler
+                    zaehler += 1
+                    stapel.append(v)
+                    auf_stapel[v] = True
+                    aufrufe.append((v, indptr[v]))
+                elif auf_stapel[v]:
+                    tiefster[u] = min(tiefster[u], index[v])
+                continue
+
+            aufrufe.pop()
+            if aufrufe:
+                vorgaenger = aufrufe[-1][0]
+                tiefster[vorgaenger] = min(tiefster[vorgaenger], tiefster[u])
+            if tiefster[u] == index[u]:
+                while True:
+                    w = stapel.pop()
+                    auf_stapel[w] = False
+                    komponente[w] = anzahl_komponenten
+                    if w == u:
+                        break
+                anzahl_komponenten += 1
+
+    return np.array(komponente, dtype=np.int32), anzahl_komponenten
+
+
+def _konfliktpruefung_erzeugen(konflikt_maske: np.ndarray) -> Callable[[np.ndarray], bool]:
+    """
+    Erzeugt eine auf eine einzelne Fahrstraße spezialisierte Konfliktprüfung.
+    Die Konfliktmaske wird als Literal in den Quelltext eingesetzt, sodass nur
+    die tatsächlich belegten Worte geprüft werden, ohne Schleife und ohne
+    Zugriff auf die Maskenmatrix.
+    """
+    terme = [f"(aktiv_maske[{w}] & {int(wort):#x})" for w, wort in enumerate(konflikt_maske) if wort]
+    ausdruck = " | ".join(terme) if terme else "0"
+    quelltext = f"def pruefe(aktiv_maske):\n    return bool({ausdruck})\n"
+    namensraum: Dict[str, Callable[[np.ndarray], bool]] = {}
+    exec(compile(quelltext, "<konfliktpruefung>", "exec"), namensraum)
+    return namensraum["pruefe"]
+
+
+class KnotenSicht(NamedTuple):
+    """
+    Eine schreibgeschützte Sicht auf einen einzelnen Knoten im `KnotenStore`.
+    """
+    knoten_id: int
+    typ: KnotenTyp
+    kilometrierung: float
+    koordinate_x: float
+    koordinate_y: float
+
+
+class GleisSicht(NamedTuple):
+    """
+    Eine schreibgeschützte Sicht auf einen einzelnen Gleisabschnitt im `GleisStore`.
+    """
+    abschnitt_id: int
+    knoten_a_idx: int
+    knoten_b_idx: int
+    laenge: float
+    geschwindigkeitslimit: float
+
+
+class KnotenStore:
+    """
+    Alle Knotenpunkte des Netzes als parallele Spalten. Ein Knoten wird über
+    seine `knoten_id` (= Zeilenindex) angesprochen.
+    """
+
+    def __init__(self, knotenpunkte: Sequence[Knotenpunkt], ids: IdRegistry):
+        # Die Registry, aus der die Knoten-IDs stammen (für die Ausgabe der Namen).
+        self.ids = ids
+        knotenpunkte = _nach_handle(knotenpunkte, lambda k: k.knoten_id, ids)
+
+        # Einheit: Kilometer. Als float32 bleibt die Kilometrierung bis etwa
+        # 1000 km auf rund 10 cm genau, was für Metergenauigkeit reicht.
+        self.kilometrierung = np.array([k.kilometrierung for k in knotenpunkte], dtype=np.float32)
+        self.koordinate_x = np.array([k.koordinate_x for k in knotenpunkte], dtype=np.float32)
+        self.koordinate_y = np.array([k.koordinate_y for k in knotenpunkte], dtype=np.float32)
+
+        # Der jeweilige `KnotenTyp`, z.B. `knoten.typ == KnotenTyp.SIGNAL` als Maske.
+        self.typ = np.array([k.typ for k in knotenpunkte], dtype=np.int8)
+
+        # Ein Bit pro `KnotenTyp` (Bit `typ - 1`), damit sich Typen per Maske
+        # kombinieren lassen, siehe `typ_bit`.
+        self.typ_maske = np.left_shift(np.uint8(1), (self.typ - 1).astype(np.uint8))
+
+        # Die Indizes aller Knoten eines Typs, einmalig beim Laden bestimmt.
+        # Schreibgeschützt, da `knoten_vom_typ` sie direkt herausgibt.
+        self.signal_idx = np.flatnonzero(self.typ == KnotenTyp.SIGNAL).astype(np.int32)
+        self.weiche_idx = np.flatnonzero(self.typ == KnotenTyp.WEICHE).astype(np.int32)
+        self.strecken_ende_idx = np.flatnonzero(self.typ == KnotenTyp.STRECKEN_ENDE).astype(np.int32)
+        self.aufloesepunkt_idx = np.flatnonzero(self.typ == KnotenTyp.AUFLOESEPUNKT).astype(np.int32)
+        self._typ_indizes_schuetzen()
+
+        # Pro Knoten: Nachbarknoten-Index -> Indizes der verbindenden Gleisabschnitte
+        # (mehrere bei parallelen Gleisen, z.B. einer zweigleisigen Strecke), in
+        # aufsteigender Reihenfolge. Wird beim Aufbau des `GleisStore` in beide
+        # Richtungen befüllt.
+        self.nachbar_zu_gleis: List[Dict[int, List[int]]] = [{} for _ in knotenpunkte]
+
+    def __len__(self) -> int:
+        return len(self.typ)
+
+    def _typ_indizes_schuetzen(self) -> None:
+        for indizes in (self.signal_idx, self.weiche_idx, self.strecken_ende_idx, self.aufloesepunkt_idx):
+            indizes.flags.writeable = False
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Die Nachbarschafts-Dicts werden als CSR-Arrays gespeichert, damit der
+        # gesamte Zustand aus NumPy-Arrays besteht (siehe `schnappschuss`).
+        zustand = self.__dict__.copy()
+        # Pro Knoten ein Eintrag (Nachbar, Gleis) je verbindendem Gleisabschnitt.
+        nachbar_zu_gleis = zustand.pop('nachbar_zu_gleis')
+        zustand['_nachbar_indptr'], zustand['_nachbar_knoten'] = _csr(
+            [[nachbar for nachbar, gleise in n.items() for _ in gleise] for n in nachbar_zu_gleis]
+        )
+        _, zustand['_nachbar_gleis'] = _csr([[g for gleise in n.values() for g in gleise] for n in nachbar_zu_gleis])
+        return zustand
+
+    def __setstate__(self, zustand: Dict[str, Any]) -> None:
+        zustand = dict(zustand)
+        indptr = zustand.pop('_nachbar_indptr').tolist()
+        knoten = zustand.pop('_nachbar_knoten').tolist()
+        gleise = zustand.pop('_nachbar_gleis').tolist()
+        self.__dict__.update(zustand)
+        self.nachbar_zu_gleis = [{} for _ in range(len(indptr) - 1)]
+        for k, nachbarn in enumerate(self.nachbar_zu_gleis):
+            for nachbar, gleis in zip(knoten[indptr[k]:indptr[k + 1]], gleise[indptr[k]:indptr[k + 1]]):
+                nachbarn.setdefault(nachbar, []).append(gleis)
+        # Die geladenen Puffer sind beschreibbar.
+        self._typ_indizes_schuetzen()
+
+    def __getitem__(self, idx: int) -> KnotenSicht:
+        return KnotenSicht(
+            knoten_id=idx,
+            typ=KnotenTyp(int(self.typ[idx])),
+            kilometrierung=float(self.kilometrierung[idx]),
+            koordinate_x=float(self.koordinate_x[idx]),
+            koordinate_y=float(self.koordinate_y[idx]),
+        )
+
+    @staticmethod
+    def typ_bit(*typen: KnotenTyp) -> int:
+        """Die Bitmaske der angegebenen Typen, passend zu `typ_maske`."""
+        bits = 0
+        for typ in typen:
+            bits |= 1 << (typ - 1)
+        return bits
+
+    def knoten_vom_typ(self, *typen: KnotenTyp) -> np.ndarray:
+        """
+        Die Indizes aller Knoten, die einen der angegebenen Typen haben. Für
+        einen einzelnen Typ wird das beim Laden bestimmte (schreibgeschützte)
+        Array zurückgegeben.
+        """
+        if len(typen) == 1:
+            return {
+                KnotenTyp.SIGNAL: self.signal_idx,
+                KnotenTyp.WEICHE: self.weiche_idx,
+                KnotenTyp.STRECKEN_ENDE: self.strecken_ende_idx,
+                KnotenTyp.AUFLOESEPUNKT: self.aufloesepunkt_idx,
+            }[typen[0]]
+        return np.flatnonzero(self.typ_maske & self.typ_bit(*typen)).astype(np.int32)
+
+    def gleis_zwischen(self, a_idx: int, b_idx: int) -> int:
+        """
+        Der Index des Gleisabschnitts, der die Knoten `a_idx` und `b_idx` direkt
+        verbindet, oder -1, falls die Knoten nicht benachbart sind. Bei parallelen
+        Gleisen ist das der Abschnitt mit dem kleinsten Index, alle liefert
+        `gleise_zwischen`.
+        """
+        gleise = self.nachbar_zu_gleis[a_idx].get(b_idx)
+        return gleise[0] if gleise else -1
+
+    def gleise_zwischen(self, a_idx: int, b_idx: int) -> List[int]:
+        """
+        Die Indizes aller Gleisabschnitte, die die Knoten `a_idx` und `b_idx`
+        direkt verbinden, aufsteigend sortiert (leer, falls nicht benachbart).
+        """
+        return list(self.nachbar_zu_gleis[a_idx].get(b_idx, ()))
+
+
+class GleisStore:
+    """
+    Alle Gleisabschnitte des Netzes als parallele Spalten. Die angebundenen
+    Knoten sind als Indizes in den zugehörigen `KnotenStore` abgelegt.
+    """
+
+    def __init__(self, gleisabschnitte: Sequence[Gleisabschnitt], knoten: KnotenStore, ids: IdRegistry):
+        # Die Registry, aus der die Abschnitt-IDs stammen.
+        self.ids = ids
+        gleisabschnitte = _nach_handle(gleisabschnitte, lambda g: g.abschnitt_id, ids)
+
+        # Der Knotenspeicher, auf den sich `knoten_a_idx` und `knoten_b_idx` beziehen.
+        self.knoten = knoten
+
+        self.knoten_a_idx = np.empty(len(gleisabschnitte), dtype=np.int32)
+        self.knoten_b_idx = np.empty(len(gleisabschnitte), dtype=np.int32)
+        for i, g in enumerate(gleisabschnitte):
+            a_idx = g.knoten_a_id
+            b_idx = g.knoten_b_id
+            self.knoten_a_idx[i] = a_idx
+            self.knoten_b_idx[i] = b_idx
+            # Gleisabschnitte sind ungerichtet: Nachbarschaft in beide Richtungen eintragen.
+            knoten.nachbar_zu_gleis[a_idx].setdefault(b_idx, []).append(i)
+            if b_idx != a_idx:
+                knoten.nachbar_zu_gleis[b_idx].setdefault(a_idx, []).append(i)
+
+        # Einheit: Meter.
+        self.laenge = np.array([g.laenge for g in gleisabschnitte], dtype=np.float32)
+
+        # Einheit: Meter pro Sekunde (m/s).
+        self.geschwindigkeitslimit = np.array([g.geschwindigkeitslimit for g in gleisabschnitte], dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.laenge)
+
+    def __getitem__(self, idx: int) -> GleisSicht:
+        return GleisSicht(
+            abschnitt_id=idx,
+            knoten_a_idx=int(self.knoten_a_idx[idx]),
+            knoten_b_idx=int(self.knoten_b_idx[idx]),
+            laenge=float(self.laenge[idx]),
+            geschwindigkeitslimit=float(self.geschwindigkeitslimit[idx]),
+        )
+
+    def summe_laenge(self, gleis_idx: Sequence[int]) -> float:
+        """
+        Die Gesamtlänge der angegebenen Gleisabschnitte, z.B. einer Fahrstraße
+        (`Fahrstrasse.gleisabschnitte`). Einheit: Meter.
+        """
+        return float(self.laenge[np.asarray(gleis_idx, dtype=np.int32)].sum(dtype=np.float64))
+
+
+class FahrstrassenStore:
+    """
+    Alle Fahrstraßen des Netzes. Die Beziehungen zu Gleisabschnitten und
+    konfligierenden Fahrstraßen liegen als CSR-Arrays vor, sodass die Einträge
+    einer Fahrstraße ein zusammenhängender Ausschnitt eines `int32`-Arrays sind.
+    """
+
+    def __init__(self, fahrstrassen: Sequence[Fahrstrasse], gleise: GleisStore, ids: IdRegistry):
+        # Die Registry, aus der die Fahrstraßen-IDs stammen.
+        self.ids = ids
+        fahrstrassen = _nach_handle(fahrstrassen, lambda fs: fs.fahrstrasse_id, ids)
+
+        # Der Gleisspeicher, auf den sich `gleis_indices` beziehen.
+        self.gleise = gleise
+
+        self.von_knoten_idx = np.array([fs.von_knoten_id for fs in fahrstrassen], dtype=np.int32)
+        self.bis_knoten_idx = np.array([fs.bis_knoten_id for fs in fahrstrassen], dtype=np.int32)
+
+        # Die geordneten Gleisabschnitte jeder Fahrstraße.
+        self.gleis_indptr, self.gleis_indices = _csr([fs.gleisabschnitte for fs in fahrstrassen])
+
+        # Die konfligierenden Fahrstraßen jeder Fahrstraße.
+        self.konflikt_indptr, self.konflikt_indices = _csr([fs.konfligierende_fahrstrassen for fs in fahrstrassen])
+
+        # Dieselben Konflikte als Bitmaske: Bit `j` in Zeile `i` ist gesetzt,
+        # wenn Fahrstraße `i` mit Fahrstraße `j` konfligiert.
+        anzahl_worte = _anzahl_worte(len(fahrstrassen))
+        self.konflikt_maske = np.zeros((len(fahrstrassen), anzahl_worte), dtype=np.uint64)
+        zeilen = np.repeat(np.arange(len(fahrstrassen)), np.diff(self.konflikt_indptr))
+        _bits_setzen(self.konflikt_maske, zeilen, self.konflikt_indices)
+
+        # --- Dynamische Zustände ---
+
+        # Der Zug, der die Fahrstraße belegt bzw. für den sie reserviert ist
+        # (`KEIN_ZUG`, wenn frei). Geändert über `belegen`/`reservieren`.
+        self.belegt = np.array([fs.belegt_von_zug_id for fs in fahrstrassen], dtype=np.int32)
+        self.reserviert = np.array([fs.reserviert_fuer_zug_id for fs in fahrstrassen], dtype=np.int32)
+
+        # Bitmaske aller Fahrstraßen, die aktuell belegt oder reserviert sind.
+        self.aktiv_maske = np.zeros(anzahl_worte, dtype=np.uint64)
+        for fs_idx in np.flatnonzero((self.belegt != KEIN_ZUG) | (self.reserviert != KEIN_ZUG)):
+            self._aktiv_aktualisieren(int(fs_idx))
+
+        # Spezialisierte Konfliktprüfungen für häufig angeforderte Fahrstraßen,
+        # siehe `spezialisieren`.
+        self._konfliktpruefungen: Dict[int, Callable[[np.ndarray], bool]] = {}
+
+    def __len__(self) -> int:
+        return len(self.von_knoten_idx)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Die erzeugten Konfliktprüfungen lassen sich nicht picklen; gespeichert
+        # wird nur, für welche Fahrstraßen sie existieren.
+        zustand = self.__dict__.copy()
+        zustand['_konfliktpruefungen'] = list(self._konfliktpruefungen)
+        return zustand
+
+    def __setstate__(self, zustand: Dict[str, Any]) -> None:
+        self.__dict__.update(zustand)
+        if 'laenge' in zustand:
+            # Die geladenen Puffer sind beschreibbar, siehe `laenge`.
+            self.laenge.flags.writeable = False
+        self._konfliktpruefungen = {
+            fs_idx: _konfliktpruefung_erzeugen(self.konflikt_maske[fs_idx]) for fs_idx in zustand['_konfliktpruefungen']
+        }
+
+    def gleisabschnitte(self, fs_idx: int) -> np.ndarray:
+        """Die Gleisabschnitt-Indizes der Fahrstraße in Fahrtrichtung."""
+        return self.gleis_indices[self.gleis_indptr[fs_idx]:self.gleis_indptr[fs_idx + 1]]
+
+    def konflikte(self, fs_idx: int) -> np.ndarray:
+        """Die Indizes aller mit der Fahrstraße konfligierenden Fahrstraßen."""
+        return self.konflikt_indices[self.konflikt_indptr[fs_idx]:self.konflikt_indptr[fs_idx + 1]]
+
+    @cached_property
+    def laenge(self) -> np.ndarray:
+        """
+        Die Gesamtlänge jeder Fahrstraße als Summe ihrer Gleisabschnitte.
+        Wird beim ersten Zugriff für alle Fahrstraßen auf einmal berechnet und
+        ist schreibgeschützt, da alle Aufrufer dasselbe Array erhalten.
+        Einheit: Meter.
+        """
+        # Präfixsummen über die Gleislängen in CSR-Reihenfolge; die Länge einer
+        # Fahrstraße ist die Differenz an ihren Zeilengrenzen.
+        summen = np.zeros(len(self.gleis_indices) + 1, dtype=np.float64)
+        np.cumsum(self.gleise.laenge[self.gleis_indices], dtype=np.float64, out=summen[1:])
+        laenge = (summen[self.gleis_indptr[1:]] - summen[self.gleis_indptr[:-1]]).astype(np.float32)
+        laenge.flags.writeable = False
+        return laenge
+
+    @cached_property
+    def erreichbar(self) -> np.ndarray:
+        """
+        Die Erreichbarkeitsmatrix über die Knoten als Bitmaske: Bit `b` in Zeile
+        `a` ist gesetzt, wenn Knoten `b` von Knoten `a` aus über eine Folge von
+        Fahrstraßen erreichbar ist, also ohne Richtungswechsel. Jeder Knoten
+        erreicht sich selbst. Wird beim ersten Zugriff berechnet.
+        """
+        anzahl_knoten = len(self.gleise.knoten)
+        indptr, ziele = _nach_zeilen(self.von_knoten_idx, self.bis_knoten_idx, anzahl_knoten)
+
+        # Knoten einer stark zusammenhängenden Komponente erreichen dieselben
+        # Knoten. Pro Komponente wird daher eine Zeile berechnet: ihre eigenen
+        # Knoten plus alles, was ihre Nachfolger-Komponenten erreichen. Da die
+        # Nachfolger kleinere Nummern tragen, genügt ein Durchlauf.
+        komponente, anzahl_komponenten = _starke_komponenten(indptr, ziele)
+        zeilen = np.zeros((anzahl_komponenten, _anzahl_worte(anzahl_knoten)), dtype=np.uint64)
+        _bits_setzen(zeilen, komponente, np.arange(anzahl_knoten))
+
+        von_komponente = komponente[self.von_knoten_idx]
+        bis_komponente = komponente[self.bis_knoten_idx]
+        extern = von_komponente != bis_komponente
+        nachfolger_indptr, nachfolger = _nach_zeilen(
+            von_komponente[extern], bis_komponente[extern], anzahl_komponenten
+        )
+        for k in range(anzahl_komponenten):
+            anfang, ende = nachfolger_indptr[k], nachfolger_indptr[k + 1]
+            if anfang < ende:
+                zeilen[k] |= np.bitwise_or.reduce(zeilen[nachfolger[anfang:ende]], axis=0)
+
+        return zeilen[komponente]
+
+    def ist_erreichbar(self, von_idx: int, bis_idx: int) -> bool:
+        """Gibt an, ob Knoten `bis_idx` von Knoten `von_idx` aus erreichbar ist (siehe `erreichbar`)."""
+        bis_idx = int(bis_idx)
+        return bool(self.erreichbar[int(von_idx), bis_idx >> 6] & _bit(bis_idx))
+
+    def laenge_verwerfen(self) -> None:
+        """
+        Verwirft die zwischengespeicherten Längen, z.B. nachdem sich die Längen
+        im `GleisStore` geändert haben. Der nächste Zugriff berechnet sie neu.
+        """
+        self.__dict__.pop('laenge', None)
+
+    def _aktiv_aktualisieren(self, fs_idx: int) -> None:
+        # Hält das Bit der Fahrstraße in `aktiv_maske` passend zu `belegt`/`reserviert`.
+        fs_idx = int(fs_idx)
+        if self.belegt[fs_idx] != KEIN_ZUG or self.reserviert[fs_idx] != KEIN_ZUG:
+            self.aktiv_maske[fs_idx >> 6] |= _bit(fs_idx)
+        else:
+            self.aktiv_maske[fs_idx >> 6] &= ~_bit(fs_idx)
+
+    def belegen(self, fs_idx: int, zug_idx: int = KEIN_ZUG) -> None:
+        """
+        Setzt den Zug, der sich physisch auf der Fahrstraße befindet
+        (`KEIN_ZUG` hebt die Belegung auf).
+        """
+        fs_idx = int(fs_idx)
+        self.belegt[fs_idx] = zug_idx
+        self._aktiv_aktualisieren(fs_idx)
+
+    def reservieren(self, fs_idx: int, zug_idx: int = KEIN_ZUG) -> None:
+        """
+        Setzt den Zug, für den die Fahrstraße reserviert ist
+        (`KEIN_ZUG` hebt die Reservierung auf).
+        """
+        fs_idx = int(fs_idx)
+        self.reserviert[fs_idx] = zug_idx
+        self._aktiv_aktualisieren(fs_idx)
+
+    def freigeben(self, fs_idx: int) -> None:
+        """Hebt Belegung und Reservierung der Fahrstraße auf."""
+        fs_idx = int(fs_idx)
+        self.belegt[fs_idx] = KEIN_ZUG
+        self.reserviert[fs_idx] = KEIN_ZUG
+        self._aktiv_aktualisieren(fs_idx)
+
+    def ist_aktiv(self, fs_idx: int) -> bool:
+        """Gibt an, ob die Fahrstraße aktuell belegt oder reserviert ist."""
+        fs_idx = int(fs_idx)
+        return bool(self.aktiv_maske[fs_idx >> 6] & _bit(fs_idx))
+
+    def ist_blockiert(self, fs_idx: int) -> bool:
+        """
+        Gibt an, ob mindestens eine konfligierende Fahrstraße aktiv ist und die
+        Fahrstraße deshalb nicht eingestellt werden kann.
+        """
+        fs_idx = int(fs_idx)
+        pruefe = self._konfliktpruefungen.get(fs_idx)
+        if pruefe is not None:
+            return pruefe(self.aktiv_maske)
+        return bool(np.any(self.konflikt_maske[fs_idx] & self.aktiv_maske))
+
+    def einstellbar(self) -> np.ndarray:
+        """
+        Eine boolesche Maske über alle Fahrstraßen: `True`, wenn die Fahrstraße
+        weder belegt noch reserviert noch durch einen Konflikt blockiert ist.
+        """
+        blockiert = np.any(self.konflikt_maske & self.aktiv_maske, axis=1)
+        return (self.belegt == KEIN_ZUG) & (self.reserviert == KEIN_ZUG) & ~blockiert
+
+    def spezialisieren(self, anforderungen: np.ndarray, anzahl: int) -> None:
+        """
+        Erzeugt für die `anzahl` am häufigsten angeforderten Fahrstraßen eine
+        eigene Konfliktprüfung mit fest eingesetzter Konfliktmaske, die
+        `ist_blockiert` anschließend verwendet. `anforderungen` enthält pro
+        Fahrstraße die Anzahl der bisherigen Anforderungen, z.B.
+        `RoutenAnforderungStore.anforderungen_gesamt`.
+        """
+        reihenfolge = np.argsort(-np.asarray(anforderungen), kind='stable')[:anzahl]
+        self._konfliktpruefungen = {
+            int(fs_idx): _konfliktpruefung_erzeugen(self.konflikt_maske[fs_idx])
+            for fs_idx in reihenfolge
+            if anforderungen[fs_idx] > 0
+        }
+
+
+class RoutenAnforderungStore:
+    """
+    Alle offenen Routenanforderungen in einem gemeinsamen Speicher. Jede
+    Fahrstraße besitzt einen Ringpuffer; die Plätze aller Ringpuffer liegen in
+    denselben Spalten, die Plätze von Fahrstraße `fs_idx` sind
+    `anfang[fs_idx]` bis `anfang[fs_idx] + kapazitaet[fs_idx] - 1`. Läuft ein
+    Ringpuffer über, wird nur dieser mit doppelter Kapazität am Ende der Spalten
+    neu angelegt; die Plätze der übrigen Fahrstraßen bleiben unverändert.
+    """
+
+    def __init__(self, anzahl_fahrstrassen: int, kapazitaet: int = 8):
+        if kapazitaet < 1:
+            raise ValueError("Die Kapazität einer Warteschlange muss mindestens 1 sein.")
+        anzahl_plaetze = anzahl_fahrstrassen * kapazitaet
+
+        # Pro Fahrstraße: erster Platz und Kapazität ihres Ringpuffers.
+        self.anfang = np.arange(0, anzahl_plaetze, kapazitaet, dtype=np.int64)
+        self.kapazitaet = np.full(anzahl_fahrstrassen, kapazitaet, dtype=np.int32)
+
+        # Der anfordernde Zug pro Platz, `KEIN_ZUG` für einen freien Platz.
+        self.zug_idx = np.full(anzahl_plaetze, KEIN_ZUG, dtype=np.int32)
+
+        # Die angeforderte Fahrstraße pro Platz (fest durch die Lage des Platzes;
+        # -1 für Plätze eines übergelaufenen und neu angelegten Ringpuffers).
+        self.fs_idx = np.repeat(np.arange(anzahl_fahrstrassen, dtype=np.int32), kapazitaet)
+
+        # Der Simulationszeitpunkt der Anforderung pro Platz.
+        self.zeitstempel = np.zeros(anzahl_plaetze, dtype=np.int32)
+
+        # Pro Fahrstraße: Position der ältesten Anforderung im Ringpuffer
+        # und Anzahl der wartenden Anforderungen.
+        self.kopf = np.zeros(anzahl_fahrstrassen, dtype=np.int32)
+        self.anzahl = np.zeros(anzahl_fahrstrassen, dtype=np.int32)
+
+        # Pro Fahrstraße: Anzahl aller bisher eingereihten Anforderungen, z.B. als
+        # Grundlage für `FahrstrassenStore.spezialisieren`.
+        self.anforderungen_gesamt = np.zeros(anzahl_fahrstrassen, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return int(self.anzahl.sum())
+
+    def _platz(self, fs_idx: int, position: int) -> int:
+        return int(self.anfang[fs_idx]) + position % int(self.kapazitaet[fs_idx])
+
+    def _vergroessern(self, fs_idx: int) -> None:
+        # Legt den Ringpuffer der Fahrstraße mit doppelter Kapazität am Ende der
+        # Spalten neu an, die wartenden Anforderungen in FIFO-Reihenfolge am Anfang.
+        # Die alten Plätze werden nicht wiederverwendet.
+        plaetze = self.plaetze(fs_idx)
+        neu = 2 * int(self.kapazitaet[fs_idx])
+        zug_idx = np.full(neu, KEIN_ZUG, dtype=np.int32)
+        zug_idx[:len(plaetze)] = self.zug_idx[plaetze]
+        zeitstempel = np.zeros(neu, dtype=np.int32)
+        zeitstempel[:len(plaetze)] = self.zeitstempel[plaetze]
+
+        alt_anfang, alt_ende = int(self.anfang[fs_idx]), int(self.anfang[fs_idx]) + int(self.kapazitaet[fs_idx])
+        self.zug_idx[alt_anfang:alt_ende] = KEIN_ZUG
+        self.fs_idx[alt_anfang:alt_ende] = -1
+
+        self.anfang[fs_idx] = len(self.zug_idx)
+        self.kapazitaet[fs_idx] = neu
+        self.kopf[fs_idx] = 0
+        self.zug_idx = np.concatenate([self.zug_idx, zug_idx])
+        self.zeitstempel = np.concatenate([self.zeitstempel, zeitstempel])
+        self.fs_idx = np.concatenate([self.fs_idx, np.full(neu, fs_idx, dtype=np.int32)])
+
+    def einreihen(self, fs_idx: int, zug_idx: int, zeitstempel: int) -> int:
+        """
+        Hängt eine Anforderung an die Warteschlange der Fahrstraße an und gibt
+        den belegten Platz zurück. Läuft dabei der Ringpuffer der Fahrstraße
+        über, werden ihre bisher zurückgegebenen Plätze ungültig.
+        """
+        fs_idx = int(fs_idx)
+        anzahl = int(self.anzahl[fs_idx])
+        if anzahl == self.kapazitaet[fs_idx]:
+            self._vergroessern(fs_idx)
+        platz = self._platz(fs_idx, int(self.kopf[fs_idx]) + anzahl)
+        self.zug_idx[platz] = zug_idx
+        self.zeitstempel[platz] = zeitstempel
+        self.anzahl[fs_idx] = anzahl + 1
+        self.anforderungen_gesamt[fs_idx] += 1
+        return platz
+
+    def erste(self, fs_idx: int) -> int:
+        """
+        Der Platz der ältesten wartenden Anforderung der Fahrstraße, oder -1,
+        falls die Warteschlange leer ist.
+        """
+        if self.anzahl[fs_idx] == 0:
+            return -1
+        return self._platz(fs_idx, int(self.kopf[fs_idx]))
+
+    def entnehmen(self, fs_idx: int) -> int:
+        """
+        Entfernt die älteste Anforderung der Fahrstraße und gibt den Index des
+        anfordernden Zuges zurück.
+        """
+        platz = self.erste(fs_idx)
+        if platz < 0:
+            raise IndexError(f"Die Warteschlange von Fahrstraße {fs_idx} ist leer.")
+        zug_idx = int(self.zug_idx[platz])
+        self.zug_idx[platz] = KEIN_ZUG
+        self.kopf[fs_idx] = (self.kopf[fs_idx] + 1) % self.kapazitaet[fs_idx]
+        self.anzahl[fs_idx] -= 1
+        return zug_idx
+
+    def plaetze(self, fs_idx: int) -> np.ndarray:
+        """Die Plätze aller wartenden Anforderungen der Fahrstraße in FIFO-Reihenfolge."""
+        positionen = self.kopf[fs_idx] + np.arange(self.anzahl[fs_idx], dtype=np.int64)
+        return self.anfang[fs_idx] + positionen % self.kapazitaet[fs_idx]
+
+    def frueheste(self, fs_idx: int) -> int:
+        """
+        Der Platz der wartenden Anforderung mit dem kleinsten Zeitstempel, oder
+        -1, falls die Warteschlange leer ist. Bei gleichen Zeitstempeln gewinnt
+        die zuerst eingereihte Anforderung.
+        """
+        plaetze = self.plaetze(fs_idx)
+        if len(plaetze) == 0:
+            return -1
+        return int(plaetze[self.zeitstempel[plaetze].argmin()])
+
+    def entnehmen_frueheste(self, fs_idx: int) -> int:
+        """
+        Entfernt die Anforderung mit dem kleinsten Zeitstempel und gibt den Index
+        des anfordernden Zuges zurück. Die übrigen Anforderungen behalten ihre
+        Reihenfolge.
+        """
+        plaetze = self.plaetze(fs_idx)
+        if len(plaetze) == 0:
+            raise IndexError(f"Die Warteschlange von Fahrstraße {fs_idx} ist leer.")
+        position = int(self.zeitstempel[plaetze].argmin())
+        zug_idx = int(self.zug_idx[plaetze[position]])
+
+        # Die davor eingereihten Anforderungen rücken um einen Platz nach, sodass
+        # die Lücke am Kopf des Ringpuffers entsteht.
+        self.zug_idx[plaetze[1:position + 1]] = self.zug_idx[plaetze[:position]]
+        self.zeitstempel[plaetze[1:position + 1]] = self.zeitstempel[plaetze[:position]]
+        self.zug_idx[plaetze[0]] = KEIN_ZUG
+        self.kopf[fs_idx] = (self.kopf[fs_idx] + 1) % self.kapazitaet[fs_idx]
+        self.anzahl[fs_idx] -= 1
+        return zug_idx
+
+
+# --------------------------------------------------------------------------
+# ## ZÜGE: Kinematik als Batch-Update
+# --------------------------------------------------------------------------
+
+# Die Statuswerte als einfache Ganzzahlen, damit der Kern ohne Enum-Zugriffe
+# auskommt (und von Numba als Konstanten eingebettet wird).
+_STEHEND = int(ZugStatus.STEHEND)
+_BESCHLEUNIGEND = int(ZugStatus.BESCHLEUNIGEND)
+_FAHREND = int(ZugStatus.FAHREND)
+_BREMSEND = int(ZugStatus.BREMSEND)
+
+
+@njit(parallel=True, cache=True)
+def _kinematik_schritt(geschwindigkeit, max_geschwindigkeit, beschleunigung, bremsverzoegerung,
+                       status, ort_offset, dt):
+    """
+    Integriert alle Züge um einen Zeitschritt `dt` (Sekunden). Arbeitet in-place
+    und verzweigungsfrei über Masken: beschleunigende Züge werden bis zu ihrer
+    Höchstgeschwindigkeit schneller, bremsende bis zum Stillstand langsamer.
+    Erreicht ein Zug die Grenze innerhalb des Schritts, wird der Schritt dort
+    geteilt: bis zum Zeitpunkt `t_grenze` mit konstanter Beschleunigung, danach
+    mit der erreichten Geschwindigkeit. So ist der Weg exakt, z.B. genau der
+    Bremsweg `v^2 / (2 b)` bis zum Stillstand.
+    """
+    beschleunigt = status == _BESCHLEUNIGEND
+    bremst = status == _BREMSEND
+
+    # Die wirksame (vorzeichenbehaftete) Beschleunigung und die Zeit bis zur
+    # Grenze, höchstens `dt`. Das Minimum mit `1e-6` vermeidet eine Division
+    # durch 0 bei fehlender Beschleunigung bzw. Verzögerung.
+    a = np.where(beschleunigt, beschleunigung, np.where(bremst, -bremsverzoegerung, 0.0))
+    t_grenze = np.where(
+        beschleunigt,
+        np.maximum(max_geschwindigkeit - geschwindigkeit, 0.0) / np.maximum(beschleunigung, 1e-6),
+        np.where(bremst, geschwindigkeit / np.maximum(bremsverzoegerung, 1e-6), dt),
+    )
+    t_grenze = np.minimum(t_grenze, dt)
+    v_neu = np.where(
+        beschleunigt,
+        np.minimum(geschwindigkeit + beschleunigung * dt, max_geschwindigkeit),
+        np.where(bremst, np.maximum(geschwindigkeit - bremsverzoegerung * dt, 0.0), geschwindigkeit),
+    )
+    ort_offset[:] = ort_offset + geschwindigkeit * t_grenze + 0.5 * a * t_grenze * t_grenze + v_neu * (dt - t_grenze)
+
+    # Höchstgeschwindigkeit erreicht -> FAHREND, Stillstand erreicht -> STEHEND.
+    status[:] = np.where(
+        beschleunigt & (v_neu >= max_geschwindigkeit),
+        _FAHREND,
+        np.where(bremst & (v_neu <= 0.0), _STEHEND, status),
+    )
+    geschwindigkeit[:] = v_neu
+
+
+class ZugSicht(NamedTuple):
+    """
+    Eine schreibgeschützte Sicht auf den kinematischen Zustand eines Zuges im `ZugStore`.
+    """
+    zug_id: int
+    status: ZugStatus
+    geschwindigkeit: float
+    ort_typ: OrtTyp
+    ort_idx: int
+    ort_offset: float
+
+
+# Die Anzahl der Züge pro Block, passend zu einem AVX2-Register aus 8 float32.
+ZUG_LANES = 8
+
+# Ein Block aus `ZUG_LANES` Zügen (Array-of-Structs-of-Arrays): jede Eigenschaft
+# als kleines Array über die Züge des Blocks, alle Eigenschaften eines Blocks
+# direkt hintereinander im Speicher.
+ZUG_BLOCK = np.dtype([
+    ('max_geschwindigkeit', np.float32, ZUG_LANES),
+    ('beschleunigung', np.float32, ZUG_LANES),
+    ('bremsverzoegerung', np.float32, ZUG_LANES),
+    ('geschwindigkeit', np.float32, ZUG_LANES),
+    ('ort_offset', np.float32, ZUG_LANES),
+    ('ort_idx', np.int32, ZUG_LANES),
+    ('ort_typ', np.int8, ZUG_LANES),
+    ('status', np.int8, ZUG_LANES),
+])
+
+
+def _block_spalte(name: str, doc: str) -> property:
+    # Eine Eigenschaft aller Züge als flaches Array, Eintrag `i` für Zug `i`.
+    # Da die Spuren blockweise verteilt liegen, ist das eine Kopie; sie ist
+    # schreibgeschützt, damit Schreibzugriffe nicht stillschweigend verloren
+    # gehen (geschrieben wird über `spalte_setzen`).
+    def lesen(self) -> np.ndarray:
+        spalte = self.bloecke[name].reshape(-1)[:self.anzahl].copy()
+        spalte.flags.writeable = False
+        return spalte
+    return property(lesen, doc=doc)
+
+
+class ZugStore:
+    """
+    Der kinematische Zustand aller Züge, in Blöcken zu je `ZUG_LANES` Zügen
+    (`ZUG_BLOCK`). Zug `i` liegt in Block `i // ZUG_LANES` auf Spur
+    `i % ZUG_LANES`. Ein Simulationsschritt aktualisiert alle Züge gemeinsam
+    (`schritt`) statt einzeln; da er mehrere Eigenschaften je Zug liest, liegen
+    diese blockweise beieinander statt in getrennten Spalten.
+
+    Die Eigenschaften (`geschwindigkeit`, `status`, ...) sind flache,
+    schreibgeschützte Kopien mit einem Eintrag pro Zug; geändert werden sie
+    über `spalte_setzen`. Die (Blöcke x ZUG_LANES)-Sichten für Batch-Kerne
+    liefert `bloecke[name]`.
+    """
+
+    def __init__(self, zuege: Sequence[Zug], ids: IdRegistry):
+        # Die Registry, aus der die Zug-IDs stammen.
+        self.ids = ids
+        zuege = _nach_handle(zuege, lambda z: z.zug_id, ids)
+        self.anzahl = len(zuege)
+
+        # Nicht belegte Spuren im letzten Block stehen mit Geschwindigkeit 0
+        # still, sodass `schritt` sie unverändert lässt.
+        self.bloecke = np.zeros((self.anzahl + ZUG_LANES - 1) // ZUG_LANES, dtype=ZUG_BLOCK)
+        self.bloecke['status'] = ZugStatus.STEHEND
+
+        alle = np.arange(self.anzahl)
+        self.spalte_setzen('max_geschwindigkeit', alle, [z.max_geschwindigkeit for z in zuege])
+        self.spalte_setzen('beschleunigung', alle, [z.beschleunigung for z in zuege])
+        self.spalte_setzen('bremsverzoegerung', alle, [z.bremsverzoegerung for z in zuege])
+        self.spalte_setzen('status', alle, [z.status for z in zuege])
+        self.spalte_setzen('geschwindigkeit', alle, [z.aktuelle_geschwindigkeit for z in zuege])
+        self.spalte_setzen('ort_typ', alle, [z.ort_typ for z in zuege])
+        self.spalte_setzen('ort_idx', alle, [z.ort_idx for z in zuege])
+        self.spalte_setzen('ort_offset', alle, [z.ort_offset for z in zuege])
+
+    def spalte_setzen(self, name: str, zuege: Any, werte: Any) -> None:
+        """
+        Setzt die Eigenschaft `name` (ein Feld von `ZUG_BLOCK`) der Züge mit den
+        Indizes `zuege`, z.B. `spalte_setzen('status', [3, 9], ZugStatus.BREMSEND)`.
+        """
+        zuege = np.asarray(zuege, dtype=np.int64)
+        if np.any((zuege < 0) | (zuege >= self.anzahl)):
+            raise IndexError(f"Zugindex außerhalb von 0..{self.anzahl - 1}.")
+        self.bloecke[name][zuege // ZUG_LANES, zuege % ZUG_LANES] = werte
+
+    # --- Statische Eigenschaften ---
+
+    max_geschwindigkeit = _block_spalte('max_geschwindigkeit', "Einheit: Meter pro Sekunde (m/s).")
+    beschleunigung = _block_spalte('beschleunigung', "Einheit: Meter pro Sekunde zum Quadrat (m/s^2).")
+    bremsverzoegerung = _block_spalte('bremsverzoegerung', "Einheit: Meter pro Sekunde zum Quadrat (m/s^2).")
+
+    # --- Dynamische Zustände ---
+
+    status = _block_spalte('status', "Der jeweilige `ZugStatus`.")
+    geschwindigkeit = _block_spalte('geschwindigkeit', "Einheit: Meter pro Sekunde (m/s).")
+
+    # Die Position des Zuganfangs wie in `Zug`: Art des Elements (`OrtTyp`),
+    # Index des Knotens bzw. Gleisabschnitts und Fortschritt darauf.
+    ort_typ = _block_spalte('ort_typ', "Die Art des Elements (`OrtTyp`).")
+    ort_idx = _block_spalte('ort_idx', "Der Index des Knotens bzw. Gleisabschnitts.")
+    ort_offset = _block_spalte('ort_offset', "Der Fortschritt im Element. Einheit: Meter.")
+
+    def __len__(self) -> int:
+        return self.anzahl
+
+    def __getitem__(self, idx: int) -> ZugSicht:
+        block = self.bloecke[idx // ZUG_LANES]
+        spur = idx % ZUG_LANES
+        return ZugSicht(
+            zug_id=idx,
+            status=ZugStatus(int(block['status'][spur])),
+            geschwindigkeit=float(block['geschwindigkeit'][spur]),
+            ort_typ=OrtTyp(int(block['ort_typ'][spur])),
+            ort_idx=int(block['ort_idx'][spur]),
+            ort_offset=float(block['ort_offset'][spur]),
+        )
+
+    def mit_status(self, status: ZugStatus) -> np.ndarray:
+        """Die Indizes aller Züge, die sich aktuell im angegebenen Status befinden."""
+        # Flacher Index über (Block, Spur) ist gerade der Zugindex; die freien
+        # Spuren des letzten Blocks werden abgeschnitten.
+        zuege = np.flatnonzero(self.bloecke['status'] == status)
+        return zuege[zuege < self.anzahl]
+
+    def schritt(self, dt: float) -> None:
+        """Integriert die Bewegung aller Züge um `dt` Sekunden."""
+        # Der Kern arbeitet elementweise über (Block, Spur); Numba fasst die
+        # Ausdrücke zu einer Schleife über die Blöcke zusammen.
+        bloecke = self.bloecke
+        _kinematik_schritt(
+            bloecke['geschwindigkeit'], bloecke['max_geschwindigkeit'], bloecke['beschleunigung'],
+            bloecke['bremsverzoegerung'], bloecke['status'], bloecke['ort_offset'], np.float32(dt),
+        )
+
+
+# --------------------------------------------------------------------------
+# ## SCHNAPPSCHÜSSE: Zustand zwischen Simulationsschritten sichern
+#
+# Die Spaltenspeicher bestehen fast nur aus NumPy-Arrays. Mit Pickle-Protokoll 5
+# werden deren Daten nicht in den Pickle-Strom kopiert, sondern als separate
+# Puffer ("out-of-band") übergeben; das Sichern kostet dann im Wesentlichen
+# ein Kopieren des Speichers pro Spalte.
+# --------------------------------------------------------------------------
+
+def schnappschuss(objekt: Any) -> Tuple[bytes, List[bytearray]]:
+    """
+    Sichert ein Objekt (z.B. einen Spaltenspeicher oder ein Tupel mehrerer
+    Speicher) als Pickle-Daten plus Array-Puffer. Die Puffer sind Kopien, der
+    Schnappschuss bleibt also unverändert, wenn die Simulation weiterläuft.
+    """
+    puffer: List[pickle.PickleBuffer] = []
+    daten = pickle.dumps(objekt, protocol=5, buffer_callback=puffer.append)
+    return daten, [bytearray(p.raw()) for p in puffer]
+
+
+def schnappschuss_laden(daten: bytes, puffer: Sequence[bytearray]) -> Any:
+    """
+    Stellt ein mit `schnappschuss` gesichertes Objekt wieder her. Die Puffer
+    werden kopiert, sodass derselbe Schnappschuss mehrfach geladen werden kann.
+    """
+    return pickle.loads(daten, buffers=[bytearray(p) for p in puffer])
@@ -1,14 +1,20 @@
 # src/rail_types.py
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
-from enum import Enum, auto
+from collections import deque
+from dataclasses import dataclass, field, fields
+from typing import Any, Deque, Dict, List, Optional, Sequence
+from enum import IntEnum, auto
+
+import numpy as np
 
 # --------------------------------------------------------------------------
 # ## ENUMS: Für klar definierte Zustände
+#
+# Als `IntEnum`, damit Vergleiche reine Ganzzahlvergleiche sind und die Werte
+# direkt in `int8`-Spalten der Spaltenspeicher abgelegt werden können.
 # --------------------------------------------------------------------------
 
-class KnotenTyp(Enum):
+class KnotenTyp(IntEnum):
     """
     Definiert die 4 möglichen Arten von Knotenpunkten, die die physische
     Infrastruktur aufspannen.
@@ -19,7 +25,7 @@ class KnotenTyp(Enum):
     AUFLOESEPUNKT = auto()  # Ein Punkt in der Topologie für Teilfahrstraßenauflösung
                             
 
-class ZugStatus(Enum):
+class ZugStatus(IntEnum):
     """
     Definiert die möglichen physikalischen Zustände, in denen sich ein Zug
     befinden kann. (BLEIBT UNVERÄNDERT)
@@ -30,6 +36,63 @@ class ZugStatus(Enum):
     BREMSEND = auto()
 
 
+class OrtTyp(IntEnum):
+    """
+    Definiert, auf welcher Art von Infrastruktur-Element sich ein Zuganfang
+    befindet.
+    """
+    KNOTEN = 0      # Der Zug steht genau auf einem Knotenpunkt.
+    ABSCHNITT = 1   # Der Zug befindet sich auf einem Gleisabschnitt.
+
+
+# --------------------------------------------------------------------------
+# ## IDS: Ganzzahlige Handles statt Strings
+#
+# Alle IDs (Knoten, Gleisabschnitte, Fahrstraßen, Züge) werden beim Laden
+# einmalig in fortlaufende Ganzzahlen übersetzt. Die Klassen unten tragen
+# nur noch diese Handles; Strings gibt es nur noch an den Ein-/Ausgabegrenzen.
+# Jede Art von ID hat ihre eigene Registry, sodass die Handles dicht bei 0
+# beginnen und direkt als Index in die Spaltenspeicher dienen.
+# --------------------------------------------------------------------------
+
+class IdRegistry:
+    """
+    Vergibt für String-IDs fortlaufende ganzzahlige Handles (0, 1, 2, ...)
+    und erlaubt die Rückübersetzung eines Handles in seinen Namen.
+    """
+
+    def __init__(self):
+        self._handles: Dict[str, int] = {}
+        self._namen: List[str] = []
+
+    def intern(self, name: str) -> int:
+        """Gibt das Handle zu `name` zurück und vergibt bei Bedarf ein neues."""
+        handle = self._handles.get(name)
+        if handle is None:
+            handle = len(self._namen)
+            self._handles[name] = handle
+            self._namen.append(name)
+        return handle
+
+    def name(self, handle: int) -> str:
+        """Der ursprüngliche String zu einem Handle."""
+        return self._namen[handle]
+
+    def __getitem__(self, name: str) -> int:
+        # Wie `intern`, vergibt aber kein neues Handle (KeyError bei unbekannter ID).
+        return self._handles[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._handles
+
+    def __len__(self) -> int:
+        return len(self._namen)
+
+
+# Platzhalter-ID für "kein Zug", z.B. für eine freie Fahrstraße.
+KEIN_ZUG = -1
+
+
 # --------------------------------------------------------------------------
 # ## 1. PHYSIKALISCHE INFRASTRUKTUR (STATISCH)
 #
@@ -37,14 +100,15 @@ class ZugStatus(Enum):
 # Sie sind die "Hardware".
 # --------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Knotenpunkt:
     """
     Ein Knoten im Graphen unseres Schienennetzes. Jeder Knoten hat eine
     exakte geografische und betriebliche Position.
     """
-    # Eindeutige ID, z.B. 'weiche_12a' oder 'signal_42'.
-    knoten_id: str
+    # Eindeutige ID als Handle aus der Knoten-`IdRegistry`,
+    # z.B. für 'weiche_12a' oder 'signal_42'.
+    knoten_id: int
     
     # Der Typ des Knotenpunkts, definiert durch das Enum 'KnotenTyp'.
     typ: KnotenTyp
@@ -59,20 +123,21 @@ class Knotenpunkt:
     koordinate_y: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Gleisabschnitt:
     """
     Eine ungerichtete Kante im Graphen, die zwei Knotenpunkte physisch
     miteinander verbindet. Repräsentiert das reine Gleis ohne Fahrtrichtung.
     """
-    # Eindeutige ID, z.B. 'gleis_twh_gbl_1'.
-    abschnitt_id: str
+    # Eindeutige ID als Handle aus der Abschnitts-`IdRegistry`,
+    # z.B. für 'gleis_twh_gbl_1'.
+    abschnitt_id: int
     
     # Die ID des einen angebundenen Knotenpunkts.
-    knoten_a_id: str
+    knoten_a_id: int
     
     # Die ID des anderen angebundenen Knotenpunkts.
-    knoten_b_id: str
+    knoten_b_id: int
     
     # Die physikalische Länge des Gleisabschnitts.
     # Diese wird typischerweise aus der Differenz der Kilometrierung
@@ -92,87 +157,124 @@ class Gleisabschnitt:
 # Sie sind die "Software".
 # --------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Fahrstrasse:
     """
     Eine gesicherte, gerichtete Route für einen Zug von einem Start- zu
     einem Ziel-Signal. Sie besteht aus einer geordneten Kette von
     Gleisabschnitten und kann nur von einem Zug gleichzeitig genutzt werden.
     """
-    # Eindeutige ID, z.B. 'fs_sig42_sig45_via_w12a'.
-    fahrstrasse_id: str
+    # Eindeutige ID als Handle aus der Fahrstraßen-`IdRegistry`,
+    # z.B. für 'fs_sig42_sig45_via_w12a'.
+    fahrstrasse_id: int
 
     # Die geordnete Liste der Gleisabschnitt-IDs, aus denen diese Fahrstraße besteht.
-    gleisabschnitte: List[str]
+    # Die Gesamtlänge der Fahrstraße wird daraus nicht hier gespeichert, sondern
+    # bei Bedarf berechnet und zwischengespeichert (`FahrstrassenStore.laenge`).
+    gleisabschnitte: List[int]
 
     # Der Startknoten dieser Fahrstraße (typischerweise ein Signal).
-    von_knoten_id: str
+    von_knoten_id: int
 
     # Der Zielknoten dieser Fahrstraße (typischerweise ein Signal).
-    bis_knoten_id: str
-
-    # Die Gesamtlänge der Fahrstraße.
-    # Ergibt sich aus der Summe der Längen der enthaltenen Gleisabschnitte.
-    # Einheit: Meter.
-    laenge: float
+    bis_knoten_id: int
 
     # Eine Liste der IDs aller anderen Fahrstraßen, die nicht gleichzeitig
     # aktiv sein dürfen, weil sie mindestens einen Gleisabschnitt teilen
     # oder Weichen in einer inkompatiblen Stellung benötigen.
-    konfligierende_fahrstrassen: List[str]
+    konfligierende_fahrstrassen: List[int]
 
     # Die FIFO-Warteschlange für eingehende Anforderungen von Zügen,
-    # die diese Fahrstraße nutzen möchten.
-    anforderungs_warteschlange: List['RoutenAnforderung'] = field(default_factory=list)
+    # die diese Fahrstraße nutzen möchten. Als `deque`, damit das Entnehmen
+    # der ältesten Anforderung (`popleft`) in O(1) möglich ist.
+    # Die meisten Fahrstraßen sind die meiste Zeit unbenutzt; die Warteschlange
+    # wird daher erst bei der ersten Anforderung angelegt (None bis dahin).
+    anforderungs_warteschlange: Optional[Deque['RoutenAnforderung']] = None
 
     # --- Dynamische Zustände ---
     
-    # Gibt die ID des Zuges an, der sich PHYSISCH auf der Fahrstraße befindet.
-    belegt_von_zug_id: Optional[str] = None
+    # Gibt die ID des Zuges an, der sich PHYSISCH auf der Fahrstraße befindet
+    # (`KEIN_ZUG`, wenn die Fahrstraße nicht belegt ist).
+    belegt_von_zug_id: int = KEIN_ZUG
     
-    # Gibt die ID des Zuges an, für den diese Fahrstraße ZUKÜNFTIG reserviert ist.
-    reserviert_fuer_zug_id: Optional[str] = None
+    # Gibt die ID des Zuges an, für den diese Fahrstraße ZUKÜNFTIG reserviert ist
+    # (`KEIN_ZUG`, wenn die Fahrstraße nicht reserviert ist).
+    reserviert_fuer_zug_id: int = KEIN_ZUG
 
     # Eine Liste der IDs der konfligierenden Fahrstraßen, die aktuell
     # belegt oder reserviert sind und somit diese Fahrstraße blockieren.
-    # Eine Fahrstraße kann nur eingestellt werden, wenn `belegt_von_zug_id` None ist,
-    # `reserviert_fuer_zug_id` None ist UND diese Liste leer ist.
-    blockiert_durch_konflikt_ids: List[str] = field(default_factory=list)
-
-
-
-@dataclass
+    # Eine Fahrstraße kann nur eingestellt werden, wenn `belegt_von_zug_id` KEIN_ZUG ist,
+    # `reserviert_fuer_zug_id` KEIN_ZUG ist UND diese Liste leer (oder None) ist.
+    # Wie die Warteschlange wird die Liste erst beim ersten Eintrag angelegt.
+    blockiert_durch_konflikt_ids: Optional[List[int]] = None
+
+    def _warteschlange_sicherstellen(self) -> Deque['RoutenAnforderung']:
+        if self.anforderungs_warteschlange is None:
+            self.anforderungs_warteschlange = deque()
+        return self.anforderungs_warteschlange
+
+    def _blockierungen_sicherstellen(self) -> List[int]:
+        if self.blockiert_durch_konflikt_ids is None:
+            self.blockiert_durch_konflikt_ids = []
+        return self.blockiert_durch_konflikt_ids
+
+    def anforderung_einreihen(self, anforderung: 'RoutenAnforderung') -> None:
+        """Hängt eine Anforderung an die Warteschlange an."""
+        self._warteschlange_sicherstellen().append(anforderung)
+
+    def anforderung_entnehmen(self) -> 'RoutenAnforderung':
+        """
+        Entfernt die älteste Anforderung aus der Warteschlange und gibt sie
+        zurück. Legt dabei keine Warteschlange an.
+        """
+        if not self.anforderungs_warteschlange:
+            raise IndexError(f"Die Warteschlange von Fahrstraße {self.fahrstrasse_id} ist leer.")
+        return self.anforderungs_warteschlange.popleft()
+
+    def blockierung_eintragen(self, fahrstrasse_id: int) -> None:
+        """Vermerkt eine konfligierende Fahrstraße, die diese Fahrstraße aktuell blockiert."""
+        self._blockierungen_sicherstellen().append(fahrstrasse_id)
+
+    def blockierung_aufheben(self, fahrstrasse_id: int) -> None:
+        """Entfernt eine mit `blockierung_eintragen` vermerkte konfligierende Fahrstraße."""
+        if not self.blockiert_durch_konflikt_ids or fahrstrasse_id not in self.blockiert_durch_konflikt_ids:
+            raise ValueError(f"Fahrstraße {fahrstrasse_id} blockiert Fahrstraße {self.fahrstrasse_id} nicht.")
+        self.blockiert_durch_konflikt_ids.remove(fahrstrasse_id)
+
+
+@dataclass(frozen=True, slots=True)
 class RoutenAnforderung:
     """
     Repräsentiert die Anforderung eines Zuges, eine bestimmte Fahrstraße zu
     reservieren. (fordert eine Fahrstraße an)
     """
     # Die ID des Zuges, der die Route anfordert.
-    zug_id: str
+    zug_id: int
     
     # Die ID der gewünschten Fahrstraße.
-    fahrstrasse_id: str
+    fahrstrasse_id: int
     
     # Der Simulationszeitpunkt, zu dem die Anforderung erstellt wurde.
     zeitstempel: int
 
 
 # --------------------------------------------------------------------------
-# ## ZUG-KLASSEN (vorerst unverändert)
+# ## ZUG-KLASSEN: Fahrplan als Spalten
 # --------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FahrplanEintrag:
     """
     Beschreibt einen Schritt im Fahrplan. Der Fahrplan ist eine geordnete
     Liste dieser Einträge. Jeder Eintrag definiert das nächste Signal-Ziel
     und die exakte Fahrstraße, die dorthin genommen werden soll.
+    Im `Zug` wird der Fahrplan spaltenweise abgelegt (`Zug.fahrplan_spalten`).
     """
     # Die ID der Fahrstraße, die der Zug anfordern muss, um zum Ziel-Signal zu gelangen.
-    fahrstrasse_id: str
+    fahrstrasse_id: int
 
     # Die ID des Ziel-Signals, das am Ende der Fahrstraße erreicht wird.
-    signal_id: str
+    signal_id: int
     
     # Die geplante Ankunftszeit an diesem Signal. Kann None sein, wenn es
     # nur ein Durchfahrtspunkt ohne Zeitmessung ist.
@@ -184,7 +286,11 @@ class FahrplanEintrag:
     # Einheit: Sekunden seit Simulationsstart.
     geplante_abfahrt: Optional[int] = None
 
-@dataclass
+
+# Platzhalter in den Fahrplan-Spalten für eine nicht angegebene (None) Zeit.
+KEINE_ZEIT = -1
+
+@dataclass(slots=True, eq=False)
 class Zug:
     """
     Repräsentiert einen einzelnen Zug mit all seinen statischen Eigenschaften
@@ -192,8 +298,8 @@ class Zug:
     """
     # --- Statische Eigenschaften ---
     
-    # Eindeutige ID des Zuges, z.B. 'ICE_101'.
-    zug_id: str
+    # Eindeutige ID als Handle aus der Zug-`IdRegistry`, z.B. für 'ICE_101'.
+    zug_id: int
     
     # Zugtyp, z.B. 'ICE', 'Regionalbahn', 'Güterzug'.
     zug_typ: str
@@ -215,8 +321,16 @@ class Zug:
     # Einheit: Meter pro Sekunde zum Quadrat (m/s^2).
     bremsverzoegerung: float
     
-    # Der vollständige Fahrplan des Zuges als eine Liste von Einträgen.
-    fahrplan: List[FahrplanEintrag]
+    # Der vollständige Fahrplan des Zuges, spaltenweise als `int32`-Arrays:
+    # Eintrag `i` besteht aus `fahrplan_fs_idx[i]`, `fahrplan_signal_idx[i]`,
+    # `fahrplan_ankunft[i]` und `fahrplan_abfahrt[i]` (siehe `FahrplanEintrag`).
+    # Fehlende Zeiten sind als `KEINE_ZEIT` abgelegt. Erzeugt werden die
+    # Spalten mit `Zug.fahrplan_spalten`. Der Zug hält eigene, schreibgeschützte
+    # Kopien der Spalten; ein neuer Fahrplan wird mit `fahrplan_setzen` eingetragen.
+    fahrplan_fs_idx: np.ndarray
+    fahrplan_signal_idx: np.ndarray
+    fahrplan_ankunft: np.ndarray
+    fahrplan_abfahrt: np.ndarray
     
     # --- Dynamische Zustände (ändern sich in jedem Simulationsschritt) ---
     
@@ -227,11 +341,20 @@ class Zug:
     # Einheit: Meter pro Sekunde (m/s).
     aktuelle_geschwindigkeit: float = 0.0
     
-    # Die aktuelle Position des ZUGANFANGS. Dargestellt als Tupel, das
-    # angibt, WO sich der Zug befindet und wie weit er in diesem Element fortgeschritten ist.
-    # Beispiele: ('abschnitt', 'gleis_A_B_1', 520.5) -> auf Gleisabschnitt, 520.5m vom Anfang entfernt
-    #            ('knoten', 'weiche_12a', 0) -> steht genau auf einem Knotenpunkt
-    aktuelle_position: Tuple[str, str, float] = ('knoten', 'start_node', 0.0)
+    # Die aktuelle Position des ZUGANFANGS, aufgeteilt in drei Felder, die
+    # angeben, WO sich der Zug befindet und wie weit er in diesem Element fortgeschritten ist.
+    # Beispiele: OrtTyp.ABSCHNITT, <id von 'gleis_A_B_1'>, 520.5 -> auf Gleisabschnitt, 520.5m vom Anfang entfernt
+    #            OrtTyp.KNOTEN, <id von 'weiche_12a'>, 0.0 -> steht genau auf einem Knotenpunkt
+
+    # Die Art des Elements, definiert durch das Enum 'OrtTyp'.
+    ort_typ: OrtTyp = OrtTyp.KNOTEN
+
+    # Die ID des Knotens bzw. Gleisabschnitts (je nach `ort_typ`).
+    ort_idx: int = 0
+
+    # Der Fortschritt innerhalb des Elements.
+    # Einheit: Meter.
+    ort_offset: float = 0.0
 
     # Die aktuelle Verspätung des Zuges im Vergleich zum Fahrplan.
     # Eine positive Zahl bedeutet Verspätung, eine negative Verfrühung.
@@ -247,4 +370,135 @@ class Zug:
 
     # Ein Flag, das anzeigt, ob der Zug bereits eine Route zu seinem
     # ÜBERNÄCHSTEN Zielknoten angefordert hat (wichtig für kurze Blöcke).
-    hat_route_angefordert_uebernaechste: bool = False
\ No newline at end of file
+    hat_route_angefordert_uebernaechste: bool = False
+
+    # --- Zwischenspeicher (nicht Teil des Zustands) ---
+
+    # Die Fahrstraßen-IDs des nächsten und übernächsten Fahrplaneintrags, gültig
+    # für den Eintrag `_fahrstrassen_fuer_idx`. Sie ändern sich nur, wenn der Zug
+    # einen Fahrplaneintrag erreicht, und werden daher nicht jeden Schritt neu
+    # aus dem Fahrplan gelesen (siehe `naechste_fahrstrasse`).
+    _fahrstrassen_fuer_idx: int = field(default=-1, init=False, repr=False, compare=False)
+    _naechste_fs_idx: int = field(default=-1, init=False, repr=False, compare=False)
+    _uebernaechste_fs_idx: int = field(default=-1, init=False, repr=False, compare=False)
+
+    # Die vom Zug selbst angelegte, schreibgeschützte Spalte `fahrplan_fs_idx`.
+    # Ist `fahrplan_fs_idx` ein anderes Array, wurde die Spalte direkt neu
+    # zugewiesen, und die zwischengespeicherten Fahrstraßen sind ungültig.
+    _fahrplan_spalte: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._fahrplan_schuetzen()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Nur die Felder, ohne Zwischenspeicher.
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+
+    def __setstate__(self, zustand: Dict[str, Any]) -> None:
+        for name, wert in zustand.items():
+            setattr(self, name, wert)
+        self._naechste_fs_idx = self._uebernaechste_fs_idx = -1
+        self._fahrplan_schuetzen()
+
+    def __eq__(self, other: object) -> bool:
+        # Wie der von `dataclass` erzeugte Vergleich, aber die Fahrplan-Spalten
+        # werden als Ganzes verglichen statt elementweise.
+        if not isinstance(other, Zug):
+            return NotImplemented
+        for f in fields(self):
+            if not f.compare:
+                continue
+            a, b = getattr(self, f.name), getattr(other, f.name)
+            if not (np.array_equal(a, b) if isinstance(a, np.ndarray) else a == b):
+                return False
+        return True
+
+    def _fahrplan_schuetzen(self) -> None:
+        # Legt eigene, schreibgeschützte Kopien der Fahrplan-Spalten an (die
+        # übergebenen Arrays bleiben unverändert) und verwirft die
+        # zwischengespeicherten Fahrstraßen.
+        for name in ('fahrplan_fs_idx', 'fahrplan_signal_idx', 'fahrplan_ankunft', 'fahrplan_abfahrt'):
+            spalte = np.array(getattr(self, name), dtype=np.int32)
+            spalte.flags.writeable = False
+            setattr(self, name, spalte)
+        self._fahrplan_spalte = self.fahrplan_fs_idx
+        self._fahrstrassen_fuer_idx = -1
+
+    def _fahrstrassen_gueltig(self) -> bool:
+        return (self._fahrstrassen_fuer_idx == self.naechster_fahrplan_eintrag_idx
+                and self._fahrplan_spalte is self.fahrplan_fs_idx)
+
+    def _fahrstrassen_aktualisieren(self) -> None:
+        if self._fahrplan_spalte is not self.fahrplan_fs_idx:
+            self._fahrplan_schuetzen()
+        idx = self.naechster_fahrplan_eintrag_idx
+        anzahl = len(self.fahrplan_fs_idx)
+        self._naechste_fs_idx = int(self.fahrplan_fs_idx[idx]) if idx < anzahl else -1
+        self._uebernaechste_fs_idx = int(self.fahrplan_fs_idx[idx + 1]) if idx + 1 < anzahl else -1
+        self._fahrstrassen_fuer_idx = idx
+
+    def naechste_fahrstrasse(self) -> int:
+        """
+        Die ID der Fahrstraße des nächsten Fahrplaneintrags, oder -1, wenn der
+        Fahrplan abgearbeitet ist.
+        """
+        if not self._fahrstrassen_gueltig():
+            self._fahrstrassen_aktualisieren()
+        return self._naechste_fs_idx
+
+    def uebernaechste_fahrstrasse(self) -> int:
+        """
+        Die ID der Fahrstraße des übernächsten Fahrplaneintrags, oder -1, wenn
+        es keinen mehr gibt.
+        """
+        if not self._fahrstrassen_gueltig():
+            self._fahrstrassen_aktualisieren()
+        return self._uebernaechste_fs_idx
+
+    def fahrplan_fortschalten(self) -> None:
+        """
+        Rückt zum nächsten Fahrplaneintrag vor, nachdem der Zug das Ziel-Signal
+        des aktuellen erreicht hat. Die übernächste Route wird dabei zur nächsten,
+        samt ihrem Anforderungs-Flag.
+        """
+        self.naechster_fahrplan_eintrag_idx += 1
+        self.hat_route_angefordert_naechste = self.hat_route_angefordert_uebernaechste
+        self.hat_route_angefordert_uebernaechste = False
+        self._fahrstrassen_aktualisieren()
+
+    def fahrplan_setzen(self, fahrplan: Sequence[FahrplanEintrag]) -> None:
+        """
+        Ersetzt den Fahrplan des Zuges, z.B. nach einer Umleitung.
+        `naechster_fahrplan_eintrag_idx` zeigt danach in den neuen Fahrplan.
+        """
+        for name, spalte in Zug.fahrplan_spalten(fahrplan).items():
+            setattr(self, name, spalte)
+        self._fahrplan_schuetzen()
+
+    @staticmethod
+    def fahrplan_spalten(fahrplan: Sequence[FahrplanEintrag]) -> Dict[str, np.ndarray]:
+        """
+        Packt eine Liste von Fahrplaneinträgen in die Fahrplan-Spalten eines
+        Zuges, z.B. `Zug(..., **Zug.fahrplan_spalten(eintraege))`.
+        """
+        def zeit(wert: Optional[int]) -> int:
+            return KEINE_ZEIT if wert is None else wert
+
+        return {
+            'fahrplan_fs_idx': np.array([e.fahrstrasse_id for e in fahrplan], dtype=np.int32),
+            'fahrplan_signal_idx': np.array([e.signal_id for e in fahrplan], dtype=np.int32),
+            'fahrplan_ankunft': np.array([zeit(e.geplante_ankunft) for e in fahrplan], dtype=np.int32),
+            'fahrplan_abfahrt': np.array([zeit(e.geplante_abfahrt) for e in fahrplan], dtype=np.int32),
+        }
+
+    def fahrplan_eintrag(self, idx: int) -> FahrplanEintrag:
+        """Liest Eintrag `idx` des Fahrplans wieder als `FahrplanEintrag` aus."""
+        def zeit(wert: np.int32) -> Optional[int]:
+            return None if wert == KEINE_ZEIT else int(wert)
+
+        return FahrplanEintrag(
+            fahrstrasse_id=int(self.fahrplan_fs_idx[idx]),
+            signal_id=int(self.fahrplan_signal_idx[idx]),
+            geplante_ankunft=zeit(self.fahrplan_ankunft[idx]),
+            geplante_abfahrt=zeit(self.fahrplan_abfahrt[idx]),
+        )
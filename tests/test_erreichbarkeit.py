@@ -0,0 +1,62 @@
+# tests/test_erreichbarkeit.py
+
+import random
+from typing import List, Tuple
+
+import numpy as np
+
+from src.rail_stores import FahrstrassenStore, GleisStore, KnotenStore
+from src.rail_types import Fahrstrasse, IdRegistry, Knotenpunkt, KnotenTyp
+
+
+def _netz(anzahl_knoten: int, kanten: List[Tuple[int, int]]) -> FahrstrassenStore:
+    """Ein Netz aus Signalen, in dem jede Kante (von, bis) eine Fahrstraße ist."""
+    knoten_ids, gleis_ids, fs_ids = IdRegistry(), IdRegistry(), IdRegistry()
+    knoten = KnotenStore(
+        [Knotenpunkt(knoten_ids.intern(f'sig_{i}'), KnotenTyp.SIGNAL, 0.0, 0.0, 0.0) for i in range(anzahl_knoten)],
+        knoten_ids,
+    )
+    gleise = GleisStore([], knoten, gleis_ids)
+    fahrstrassen = [Fahrstrasse(fs_ids.intern(f'fs_{i}'), [], a, b, []) for i, (a, b) in enumerate(kanten)]
+    return FahrstrassenStore(fahrstrassen, gleise, fs_ids)
+
+
+def _erreichbar_per_tiefensuche(anzahl_knoten: int, kanten: List[Tuple[int, int]], start: int) -> set:
+    nachfolger = {i: [] for i in range(anzahl_knoten)}
+    for a, b in kanten:
+        nachfolger[a].append(b)
+    gesehen = {start}
+    offen = [start]
+    while offen:
+        for v in nachfolger[offen.pop()]:
+            if v not in gesehen:
+                gesehen.add(v)
+                offen.append(v)
+    return gesehen
+
+
+def test_erreichbarkeit_wie_tiefensuche():
+    zufall = random.Random(1)
+    anzahl_knoten = 150
+    kanten = [(zufall.randrange(anzahl_knoten), zufall.randrange(anzahl_knoten)) for _ in range(200)]
+    fs = _netz(anzahl_knoten, kanten)
+    for start in range(anzahl_knoten):
+        erwartet = _erreichbar_per_tiefensuche(anzahl_knoten, kanten, start)
+        for ziel in range(anzahl_knoten):
+            assert fs.ist_erreichbar(start, ziel) == (ziel in erwartet)
+
+
+def test_erreichbarkeit_entlang_einer_kette():
+    anzahl_knoten = 3000
+    fs = _netz(anzahl_knoten, [(i, i + 1) for i in range(anzahl_knoten - 1)])
+    assert fs.ist_erreichbar(0, anzahl_knoten - 1)
+    assert not fs.ist_erreichbar(anzahl_knoten - 1, 0)
+    assert fs.ist_erreichbar(1500, 1500)
+
+
+def test_ist_erreichbar_mit_numpy_indizes():
+    fs = _netz(60, [(i, i + 1) for i in range(59)])
+    signale = fs.gleise.knoten.knoten_vom_typ(KnotenTyp.SIGNAL)
+    assert signale.dtype == np.int32
+    assert fs.ist_erreichbar(signale[0], signale[50])
+    assert not fs.ist_erreichbar(signale[50], signale[0])
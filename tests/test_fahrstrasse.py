@@ -0,0 +1,40 @@
+# tests/test_fahrstrasse.py
+
+import pytest
+
+from src.rail_types import Fahrstrasse, RoutenAnforderung
+
+
+def test_unbenutzte_fahrstrasse_legt_nichts_an():
+    fs = Fahrstrasse(0, [0, 1], 0, 2, [3])
+
+    with pytest.raises(IndexError):
+        fs.anforderung_entnehmen()
+    with pytest.raises(ValueError):
+        fs.blockierung_aufheben(3)
+
+    assert fs.anforderungs_warteschlange is None
+    assert fs.blockiert_durch_konflikt_ids is None
+
+
+def test_anforderungen_fifo():
+    fs = Fahrstrasse(0, [0, 1], 0, 2, [3])
+    erste, zweite = RoutenAnforderung(1, 0, 10), RoutenAnforderung(2, 0, 5)
+    fs.anforderung_einreihen(erste)
+    fs.anforderung_einreihen(zweite)
+
+    assert fs.anforderung_entnehmen() is erste
+    assert fs.anforderung_entnehmen() is zweite
+    with pytest.raises(IndexError):
+        fs.anforderung_entnehmen()
+
+
+def test_blockierung_eintragen_und_aufheben():
+    fs = Fahrstrasse(0, [0, 1], 0, 2, [3, 4])
+    fs.blockierung_eintragen(3)
+    fs.blockierung_eintragen(4)
+    fs.blockierung_aufheben(3)
+
+    assert fs.blockiert_durch_konflikt_ids == [4]
+    with pytest.raises(ValueError):
+        fs.blockierung_aufheben(3)
@@ -0,0 +1,113 @@
+# tests/test_fahrstrassen_store.py
+
+from typing import Dict, List
+
+import numpy as np
+import pytest
+
+from src.rail_stores import FahrstrassenStore, GleisStore, KnotenStore, schnappschuss, schnappschuss_laden
+from src.rail_types import Fahrstrasse, Gleisabschnitt, IdRegistry, Knotenpunkt, KnotenTyp
+
+
+def _fahrstrassen(anzahl: int, konflikte: Dict[int, List[int]]) -> FahrstrassenStore:
+    """Ein Netz aus einem Knoten und `anzahl` leeren Fahrstraßen mit den angegebenen Konflikten."""
+    knoten_ids, gleis_ids, fs_ids = IdRegistry(), IdRegistry(), IdRegistry()
+    knoten = KnotenStore([Knotenpunkt(knoten_ids.intern('k'), KnotenTyp.SIGNAL, 0.0, 0.0, 0.0)], knoten_ids)
+    gleise = GleisStore([], knoten, gleis_ids)
+    fahrstrassen = [
+        Fahrstrasse(fs_ids.intern(f'fs_{i}'), [], 0, 0, konflikte.get(i, []))
+        for i in range(anzahl)
+    ]
+    return FahrstrassenStore(fahrstrassen, gleise, fs_ids)
+
+
+def test_konflikt_maske_ueber_mehrere_worte():
+    fs = _fahrstrassen(130, {0: [1, 65, 129], 65: [0]})
+    assert fs.konflikt_maske.shape == (130, 3)
+    assert list(np.flatnonzero(np.unpackbits(fs.konflikt_maske[0].view(np.uint8), bitorder='little'))) == [1, 65, 129]
+
+
+def test_ist_blockiert_mit_numpy_indizes():
+    fs = _fahrstrassen(100, {0: [40], 40: [0]})
+    # Die Speicher liefern ihre Indizes als int32; Bit 40 darf dabei nicht überlaufen.
+    fs.aktiv_maske[0] |= np.uint64(1) << np.uint64(40)
+    assert fs.ist_aktiv(np.int32(40))
+    assert fs.ist_blockiert(np.int32(0))
+    assert not fs.ist_blockiert(np.int32(40))
+    assert not fs.ist_aktiv(np.int8(7))
+
+
+def test_reservieren_mit_int32_index_blockiert_konflikt():
+    fs = _fahrstrassen(100, {0: [40], 40: [0]})
+    fs.reservieren(np.int32(40), np.int32(7))
+    assert fs.reserviert[40] == 7
+    assert fs.ist_aktiv(40)
+    assert fs.ist_blockiert(0)
+    assert not fs.einstellbar()[0]
+    assert not fs.einstellbar()[40]
+
+    fs.freigeben(np.int32(40))
+    assert not fs.ist_aktiv(40)
+    assert fs.einstellbar()[0]
+
+
+def test_belegen_und_freigeben():
+    fs = _fahrstrassen(70, {3: [66], 66: [3]})
+    fs.belegen(66, 1)
+    fs.reservieren(66, 2)
+    fs.belegen(66)
+    # Die Reservierung hält die Fahrstraße weiter aktiv.
+    assert fs.ist_blockiert(3)
+    fs.reservieren(66)
+    assert not fs.ist_blockiert(3)
+    assert list(np.flatnonzero(~fs.einstellbar())) == []
+
+
+def test_spezialisierte_konfliktpruefung_wie_allgemeine():
+    zufall = np.random.default_rng(3)
+    anzahl = 150
+    konflikte = {i: sorted(set(zufall.integers(0, anzahl, 4).tolist()) - {i}) for i in range(anzahl)}
+    konflikte[7] = []
+    allgemein = _fahrstrassen(anzahl, konflikte)
+    spezialisiert = _fahrstrassen(anzahl, konflikte)
+    anforderungen = np.zeros(anzahl, dtype=np.int64)
+    anforderungen[[0, 7, 64, 100, 149]] = [5, 4, 3, 2, 1]
+    spezialisiert.spezialisieren(anforderungen, 4)
+    assert sorted(spezialisiert._konfliktpruefungen) == [0, 7, 64, 100]
+
+    for fs_idx in zufall.integers(0, anzahl, 30):
+        allgemein.reservieren(fs_idx, 1)
+        spezialisiert.reservieren(fs_idx, 1)
+        for i in range(anzahl):
+            assert spezialisiert.ist_blockiert(i) == allgemein.ist_blockiert(i)
+    assert not spezialisiert.ist_blockiert(7)
+
+
+def test_laenge_schreibgeschuetzt_und_verwerfbar():
+    knoten_ids, gleis_ids, fs_ids = IdRegistry(), IdRegistry(), IdRegistry()
+    knoten = KnotenStore(
+        [Knotenpunkt(knoten_ids.intern(f'k_{i}'), KnotenTyp.SIGNAL, 0.0, 0.0, 0.0) for i in range(3)], knoten_ids
+    )
+    gleise = GleisStore(
+        [Gleisabschnitt(gleis_ids.intern('g_0'), 0, 1, 500.0, 30.0),
+         Gleisabschnitt(gleis_ids.intern('g_1'), 1, 2, 700.0, 30.0)],
+        knoten,
+        gleis_ids,
+    )
+    fs = FahrstrassenStore(
+        [Fahrstrasse(fs_ids.intern('fs_0'), [0, 1], 0, 2, []), Fahrstrasse(fs_ids.intern('fs_1'), [1], 1, 2, [])],
+        gleise,
+        fs_ids,
+    )
+
+    assert fs.laenge.tolist() == [1200.0, 700.0]
+    assert fs.laenge is fs.laenge
+    with pytest.raises(ValueError):
+        fs.laenge[0] = 0.0
+    assert not schnappschuss_laden(*schnappschuss(fs)).laenge.flags.writeable
+
+    # Ohne Verwerfen bleibt der zwischengespeicherte Wert bestehen.
+    gleise.laenge[1] = 800.0
+    assert fs.laenge.tolist() == [1200.0, 700.0]
+    fs.laenge_verwerfen()
+    assert fs.laenge.tolist() == [1300.0, 800.0]
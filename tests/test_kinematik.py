@@ -0,0 +1,48 @@
+# tests/test_kinematik.py
+
+import numpy as np
+import pytest
+
+from src.rail_stores import _kinematik_schritt
+from src.rail_types import ZugStatus
+
+
+def _schritt(status, v, v_max, a, b, dt):
+    """Ein Schritt des Kerns für einen einzelnen Zug; gibt (Weg, v, Status) zurück."""
+    geschwindigkeit = np.array([v], dtype=np.float32)
+    ort_offset = np.zeros(1, dtype=np.float32)
+    status_spalte = np.array([status], dtype=np.int8)
+    _kinematik_schritt(
+        geschwindigkeit, np.array([v_max], dtype=np.float32), np.array([a], dtype=np.float32),
+        np.array([b], dtype=np.float32), status_spalte, ort_offset, np.float32(dt),
+    )
+    return float(ort_offset[0]), float(geschwindigkeit[0]), ZugStatus(int(status_spalte[0]))
+
+
+def test_beschleunigen_bis_zur_hoechstgeschwindigkeit():
+    # 2 s Beschleunigung auf 2 m/s (2 m), danach 8 s mit 2 m/s (16 m).
+    assert _schritt(ZugStatus.BESCHLEUNIGEND, 0.0, 2.0, 1.0, 1.0, 10.0) == pytest.approx(
+        (18.0, 2.0, ZugStatus.FAHREND))
+
+
+def test_beschleunigen_ohne_grenze():
+    assert _schritt(ZugStatus.BESCHLEUNIGEND, 1.0, 50.0, 0.5, 1.0, 4.0) == pytest.approx(
+        (8.0, 3.0, ZugStatus.BESCHLEUNIGEND))
+
+
+def test_bremsen_bis_zum_stillstand():
+    # Bremsweg v^2 / (2 b) = 12.5 m, danach steht der Zug.
+    assert _schritt(ZugStatus.BREMSEND, 5.0, 50.0, 1.0, 1.0, 10.0) == pytest.approx(
+        (12.5, 0.0, ZugStatus.STEHEND))
+
+
+def test_bremsen_ohne_stillstand():
+    assert _schritt(ZugStatus.BREMSEND, 10.0, 50.0, 1.0, 2.0, 2.0) == pytest.approx(
+        (16.0, 6.0, ZugStatus.BREMSEND))
+
+
+def test_fahrend_und_stehend_unveraendert():
+    assert _schritt(ZugStatus.FAHREND, 20.0, 20.0, 1.0, 1.0, 3.0) == pytest.approx(
+        (60.0, 20.0, ZugStatus.FAHREND))
+    assert _schritt(ZugStatus.STEHEND, 0.0, 20.0, 1.0, 1.0, 3.0) == pytest.approx(
+        (0.0, 0.0, ZugStatus.STEHEND))
@@ -0,0 +1,95 @@
+# tests/test_netz_stores.py
+
+import numpy as np
+import pytest
+
+from src.rail_stores import GleisSicht, GleisStore, KnotenSicht, KnotenStore, schnappschuss, schnappschuss_laden
+from src.rail_types import Gleisabschnitt, IdRegistry, Knotenpunkt, KnotenTyp
+
+
+def _knoten(typen) -> KnotenStore:
+    ids = IdRegistry()
+    return KnotenStore(
+        [Knotenpunkt(ids.intern(f'k_{i}'), typ, 1.5 * i, float(i), -float(i)) for i, typ in enumerate(typen)],
+        ids,
+    )
+
+
+def _gleise(knoten: KnotenStore, kanten) -> GleisStore:
+    ids = IdRegistry()
+    return GleisStore(
+        [Gleisabschnitt(ids.intern(f'g_{i}'), a, b, laenge, 30.0) for i, (a, b, laenge) in enumerate(kanten)],
+        knoten,
+        ids,
+    )
+
+
+def test_knoten_store_spalten_und_sicht():
+    knoten = _knoten([KnotenTyp.SIGNAL, KnotenTyp.WEICHE, KnotenTyp.SIGNAL])
+
+    assert len(knoten) == 3
+    assert knoten.typ.tolist() == [KnotenTyp.SIGNAL, KnotenTyp.WEICHE, KnotenTyp.SIGNAL]
+    assert knoten.kilometrierung.dtype == np.float32
+    assert knoten.kilometrierung.tolist() == [0.0, 1.5, 3.0]
+    assert knoten[2] == KnotenSicht(knoten_id=2, typ=KnotenTyp.SIGNAL, kilometrierung=3.0,
+                                    koordinate_x=2.0, koordinate_y=-2.0)
+    assert knoten.ids.name(1) == 'k_1'
+
+
+def test_knoten_store_verlangt_jede_id_genau_einmal():
+    ids = IdRegistry()
+    a = ids.intern('a')
+    ids.intern('b')
+    with pytest.raises(ValueError):
+        KnotenStore([Knotenpunkt(a, KnotenTyp.SIGNAL, 0.0, 0.0, 0.0)], ids)
+    with pytest.raises(ValueError):
+        KnotenStore([Knotenpunkt(a, KnotenTyp.SIGNAL, 0.0, 0.0, 0.0)] * 2, ids)
+
+
+def test_gleis_store_spalten_sicht_und_summe():
+    knoten = _knoten([KnotenTyp.SIGNAL] * 3)
+    gleise = _gleise(knoten, [(0, 1, 500.0), (1, 2, 700.25)])
+
+    assert len(gleise) == 2
+    assert gleise.knoten is knoten
+    assert gleise.knoten_a_idx.tolist() == [0, 1]
+    assert gleise.knoten_b_idx.tolist() == [1, 2]
+    assert gleise[1] == GleisSicht(abschnitt_id=1, knoten_a_idx=1, knoten_b_idx=2,
+                                   laenge=700.25, geschwindigkeitslimit=30.0)
+    assert gleise.summe_laenge([0, 1]) == 1200.25
+    assert gleise.summe_laenge(np.array([1], dtype=np.int32)) == 700.25
+    assert gleise.summe_laenge([]) == 0.0
+
+
+def test_gleis_zwischen_mit_parallelen_gleisen():
+    knoten = _knoten([KnotenTyp.SIGNAL] * 3)
+    _gleise(knoten, [(0, 1, 500.0), (1, 2, 700.0), (1, 0, 505.0)])
+
+    assert knoten.gleis_zwischen(0, 1) == 0
+    assert knoten.gleis_zwischen(1, 0) == 0
+    assert knoten.gleise_zwischen(1, 0) == [0, 2]
+    assert knoten.gleis_zwischen(2, 1) == 1
+    assert knoten.gleis_zwischen(0, 2) == -1
+    assert knoten.gleise_zwischen(0, 2) == []
+
+
+def test_knoten_vom_typ():
+    knoten = _knoten([KnotenTyp.SIGNAL, KnotenTyp.WEICHE, KnotenTyp.STRECKEN_ENDE, KnotenTyp.SIGNAL,
+                      KnotenTyp.AUFLOESEPUNKT])
+
+    assert knoten.knoten_vom_typ(KnotenTyp.SIGNAL).tolist() == [0, 3]
+    assert knoten.knoten_vom_typ(KnotenTyp.AUFLOESEPUNKT).tolist() == [4]
+    assert knoten.knoten_vom_typ(KnotenTyp.WEICHE, KnotenTyp.STRECKEN_ENDE).tolist() == [1, 2]
+    assert knoten.knoten_vom_typ(KnotenTyp.SIGNAL, KnotenTyp.AUFLOESEPUNKT).tolist() == [0, 3, 4]
+    assert knoten.knoten_vom_typ().tolist() == []
+
+    bits = KnotenStore.typ_bit(KnotenTyp.SIGNAL, KnotenTyp.WEICHE)
+    assert ((knoten.typ_maske & bits) != 0).tolist() == [True, True, False, True, False]
+
+
+def test_knoten_vom_typ_schreibgeschuetzt():
+    knoten = _knoten([KnotenTyp.SIGNAL, KnotenTyp.WEICHE])
+    with pytest.raises(ValueError):
+        knoten.knoten_vom_typ(KnotenTyp.SIGNAL)[0] = 1
+    geladen = schnappschuss_laden(*schnappschuss(knoten))
+    assert not geladen.knoten_vom_typ(KnotenTyp.WEICHE).flags.writeable
@@ -0,0 +1,87 @@
+# tests/test_routen_anforderung_store.py
+import numpy as np
+import pytest
+
+from src.rail_stores import RoutenAnforderungStore
+from src.rail_types import KEIN_ZUG
+
+
+def test_einreihen_und_entnehmen_fifo():
+    store = RoutenAnforderungStore(anzahl_fahrstrassen=2, kapazitaet=4)
+    for zug_idx in (7, 3, 5):
+        store.einreihen(1, zug_idx, zeitstempel=0)
+
+    assert store.anzahl.tolist() == [0, 3]
+    assert store.erste(0) == -1
+    assert [store.entnehmen(1) for _ in range(3)] == [7, 3, 5]
+    with pytest.raises(IndexError):
+        store.entnehmen(1)
+
+
+def test_ringpuffer_laeuft_ueber_das_ende():
+    store = RoutenAnforderungStore(anzahl_fahrstrassen=1, kapazitaet=3)
+    store.einreihen(0, 1, zeitstempel=0)
+    store.einreihen(0, 2, zeitstempel=0)
+    store.entnehmen(0)
+    store.einreihen(0, 3, zeitstempel=0)
+    store.einreihen(0, 4, zeitstempel=0)
+
+    assert store.kapazitaet.tolist() == [3]
+    assert store.zug_idx[store.plaetze(0)].tolist() == [2, 3, 4]
+    assert [store.entnehmen(0) for _ in range(3)] == [2, 3, 4]
+
+
+def test_voller_ringpuffer_waechst_allein():
+    store = RoutenAnforderungStore(anzahl_fahrstrassen=3, kapazitaet=2)
+    platz_0 = store.einreihen(0, 10, zeitstempel=5)
+    platz_2 = store.einreihen(2, 30, zeitstempel=4)
+    store.einreihen(1, 20, zeitstempel=6)
+    store.einreihen(1, 21, zeitstempel=7)
+    store.entnehmen(1)
+    store.einreihen(1, 22, zeitstempel=8)
+
+    # Fahrstraße 1 ist voll und ihr Kopf steht nicht am Anfang des Ringpuffers.
+    store.einreihen(np.int32(1), 23, zeitstempel=9)
+
+    assert store.kapazitaet.tolist() == [2, 4, 2]
+    assert len(store.zug_idx) == 3 * 2 + 4
+    assert store.zug_idx[store.plaetze(1)].tolist() == [21, 22, 23]
+    assert store.zeitstempel[store.plaetze(1)].tolist() == [7, 8, 9]
+    assert store.fs_idx.tolist() == [0, 0, -1, -1, 2, 2, 1, 1, 1, 1]
+    assert store.anforderungen_gesamt.tolist() == [1, 4, 1]
+
+    # Die Plätze der übrigen Fahrstraßen bleiben gültig.
+    assert store.erste(0) == platz_0
+    assert store.erste(2) == platz_2
+    assert [store.entnehmen(1) for _ in range(3)] == [21, 22, 23]
+    assert store.zug_idx[store._platz(1, 3)] == KEIN_ZUG
+
+
+def test_frueheste_bei_gleichem_zeitstempel_die_zuerst_eingereihte():
+    store = RoutenAnforderungStore(anzahl_fahrstrassen=1, kapazitaet=4)
+    assert store.frueheste(0) == -1
+    store.einreihen(0, 1, zeitstempel=30)
+    platz = store.einreihen(0, 2, zeitstempel=10)
+    store.einreihen(0, 3, zeitstempel=10)
+
+    assert store.frueheste(0) == platz
+
+
+def test_entnehmen_frueheste_erhaelt_reihenfolge_ueber_das_ende():
+    store = RoutenAnforderungStore(anzahl_fahrstrassen=1, kapazitaet=4)
+    store.einreihen(0, 0, zeitstempel=0)
+    store.einreihen(0, 0, zeitstempel=0)
+    store.entnehmen(0)
+    store.entnehmen(0)
+    for zug_idx, zeitstempel in ((1, 40), (2, 20), (3, 10), (4, 30)):
+        store.einreihen(0, zug_idx, zeitstempel)
+
+    assert store.entnehmen_frueheste(0) == 3
+    assert store.kopf[0] == 3
+    assert store.zug_idx[store.plaetze(0)].tolist() == [1, 2, 4]
+    assert store.zeitstempel[store.plaetze(0)].tolist() == [40, 20, 30]
+    assert store.zug_idx[store._platz(0, 2)] == KEIN_ZUG
+
+    assert [store.entnehmen_frueheste(0) for _ in range(3)] == [2, 4, 1]
+    with pytest.raises(IndexError):
+        store.entnehmen_frueheste(0)
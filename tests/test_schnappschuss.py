@@ -0,0 +1,110 @@
+# tests/test_schnappschuss.py
+
+import numpy as np
+
+from src.rail_stores import (
+    FahrstrassenStore,
+    GleisStore,
+    KnotenStore,
+    RoutenAnforderungStore,
+    ZugStore,
+    schnappschuss,
+    schnappschuss_laden,
+)
+from src.rail_types import (
+    Fahrstrasse,
+    Gleisabschnitt,
+    IdRegistry,
+    Knotenpunkt,
+    KnotenTyp,
+    Zug,
+    ZugStatus,
+)
+
+
+def _speicher():
+    """Ein kleines Netz aus drei Signalen mit zwei konfligierenden Fahrstraßen und einem Zug."""
+    knoten_ids, gleis_ids, fs_ids, zug_ids = IdRegistry(), IdRegistry(), IdRegistry(), IdRegistry()
+    knoten = KnotenStore(
+        [Knotenpunkt(knoten_ids.intern(f'sig_{i}'), KnotenTyp.SIGNAL, float(i), 0.0, 0.0) for i in range(3)],
+        knoten_ids,
+    )
+    gleise = GleisStore(
+        [
+            Gleisabschnitt(gleis_ids.intern('gleis_0_1'), 0, 1, 500.0, 30.0),
+            Gleisabschnitt(gleis_ids.intern('gleis_1_2'), 1, 2, 700.0, 30.0),
+        ],
+        knoten,
+        gleis_ids,
+    )
+    fahrstrassen = FahrstrassenStore(
+        [
+            Fahrstrasse(fs_ids.intern('fs_0_2'), [0, 1], 0, 2, [1]),
+            Fahrstrasse(fs_ids.intern('fs_1_2'), [1], 1, 2, [0]),
+        ],
+        gleise,
+        fs_ids,
+    )
+    zuege = ZugStore(
+        [Zug(zug_ids.intern('ICE_1'), 'ICE', 200.0, 70.0, 0.5, 1.0, **Zug.fahrplan_spalten([]),
+             status=ZugStatus.BESCHLEUNIGEND)],
+        zug_ids,
+    )
+    anforderungen = RoutenAnforderungStore(len(fahrstrassen), kapazitaet=2)
+    return knoten, gleise, fahrstrassen, zuege, anforderungen
+
+
+def test_schnappschuss_stellt_alle_speicher_wieder_her():
+    knoten, gleise, fahrstrassen, zuege, anforderungen = _speicher()
+    fahrstrassen.reservieren(0, 0)
+    anforderungen.einreihen(1, 0, zeitstempel=12)
+    fahrstrassen.spezialisieren(anforderungen.anforderungen_gesamt, anzahl=1)
+
+    daten, puffer = schnappschuss((knoten, gleise, fahrstrassen, zuege, anforderungen))
+    knoten_neu, gleise_neu, fahrstrassen_neu, zuege_neu, anforderungen_neu = schnappschuss_laden(daten, puffer)
+
+    # Gemeinsame Verweise bleiben erhalten.
+    assert gleise_neu.knoten is knoten_neu
+    assert fahrstrassen_neu.gleise is gleise_neu
+
+    assert knoten_neu.nachbar_zu_gleis == knoten.nachbar_zu_gleis
+    assert knoten_neu.gleis_zwischen(2, 1) == 1
+    assert np.array_equal(fahrstrassen_neu.laenge, [1200.0, 700.0])
+    assert fahrstrassen_neu.ist_aktiv(0)
+    assert list(fahrstrassen_neu._konfliktpruefungen) == [1]
+    assert fahrstrassen_neu.ist_blockiert(1)
+    assert zuege_neu.status[0] == ZugStatus.BESCHLEUNIGEND
+    assert anforderungen_neu.entnehmen(1) == 0
+
+
+def test_schnappschuss_unabhaengig_von_der_simulation():
+    knoten, gleise, fahrstrassen, zuege, anforderungen = _speicher()
+    daten, puffer = schnappschuss((fahrstrassen, zuege))
+
+    # Nach dem Schnappschuss läuft die Simulation weiter.
+    fahrstrassen.belegen(1, 0)
+    zuege.schritt(1.0)
+    assert zuege.geschwindigkeit[0] > 0.0
+
+    erster = schnappschuss_laden(daten, puffer)
+    erster[0].reservieren(0, 0)
+    zweiter = schnappschuss_laden(daten, puffer)
+    for fahrstrassen_neu, zuege_neu in (erster, zweiter):
+        assert not fahrstrassen_neu.ist_aktiv(1)
+        assert zuege_neu.geschwindigkeit[0] == 0.0
+    assert not zweiter[0].ist_aktiv(0)
+
+
+def test_schnappschuss_erhaelt_parallele_gleise():
+    knoten_ids, gleis_ids = IdRegistry(), IdRegistry()
+    knoten = KnotenStore(
+        [Knotenpunkt(knoten_ids.intern(f'sig_{i}'), KnotenTyp.SIGNAL, 0.0, 0.0, 0.0) for i in range(2)],
+        knoten_ids,
+    )
+    GleisStore(
+        [Gleisabschnitt(gleis_ids.intern(f'gleis_{i}'), 0, 1, 500.0, 30.0) for i in range(2)],
+        knoten,
+        gleis_ids,
+    )
+    knoten_neu = schnappschuss_laden(*schnappschuss(knoten))
+    assert knoten_neu.gleise_zwischen(1, 0) == [0, 1]
@@ -0,0 +1,77 @@
+# tests/test_zug.py
+
+import pickle
+
+import numpy as np
+import pytest
+
+from src.rail_types import FahrplanEintrag, Zug
+
+
+def _zug(fahrstrassen):
+    fahrplan = [FahrplanEintrag(fs_idx, fs_idx, None, None) for fs_idx in fahrstrassen]
+    return Zug(0, 'ICE', 200.0, 70.0, 0.5, 1.0, **Zug.fahrplan_spalten(fahrplan))
+
+
+def test_fahrplan_setzen_verwirft_zwischengespeicherte_fahrstrassen():
+    zug = _zug([3, 4, 5])
+    zug.fahrplan_fortschalten()
+    assert zug.naechste_fahrstrasse() == 4
+
+    zug.fahrplan_setzen([FahrplanEintrag(fs_idx, fs_idx, None, None) for fs_idx in (7, 8)])
+
+    assert zug.naechste_fahrstrasse() == 8
+    assert zug.uebernaechste_fahrstrasse() == -1
+
+
+def test_fahrplan_spalten_sind_schreibgeschuetzt():
+    zug = _zug([3, 4])
+    assert zug.naechste_fahrstrasse() == 3
+    with pytest.raises(ValueError):
+        zug.fahrplan_fs_idx[0] = 9
+    assert np.array_equal(zug.fahrplan_fs_idx, [3, 4])
+
+
+def test_gleichheit_vergleicht_den_fahrplan():
+    assert _zug([3, 4]) == _zug([3, 4])
+    assert _zug([3, 4]) != _zug([3, 5])
+    assert _zug([3, 4]) != _zug([3, 4, 5])
+
+    # Die zwischengespeicherten Fahrstraßen gehören nicht zum Zustand.
+    zug = _zug([3, 4])
+    zug.naechste_fahrstrasse()
+    assert zug == _zug([3, 4])
+
+
+def test_fahrplan_spalten_werden_kopiert():
+    spalten = Zug.fahrplan_spalten([FahrplanEintrag(3, 3, None, None)])
+    zug = Zug(0, 'ICE', 200.0, 70.0, 0.5, 1.0, **spalten)
+
+    assert zug.fahrplan_fs_idx is not spalten['fahrplan_fs_idx']
+    assert spalten['fahrplan_fs_idx'].flags.writeable
+    spalten['fahrplan_fs_idx'][0] = 9
+    assert zug.naechste_fahrstrasse() == 3
+
+
+def test_direkt_zugewiesener_fahrplan_verwirft_zwischenspeicher():
+    zug = _zug([3, 4, 5])
+    assert zug.naechste_fahrstrasse() == 3
+
+    neu = np.array([7, 8])
+    zug.fahrplan_fs_idx = neu
+    assert zug.naechste_fahrstrasse() == 7
+    assert zug.uebernaechste_fahrstrasse() == 8
+    assert zug.fahrplan_fs_idx.dtype == np.int32
+    assert not zug.fahrplan_fs_idx.flags.writeable
+    assert neu.flags.writeable
+
+
+def test_geladener_zug_bleibt_geschuetzt():
+    zug = _zug([3, 4])
+    zug.fahrplan_fortschalten()
+    geladen = pickle.loads(pickle.dumps(zug))
+
+    assert geladen == zug
+    assert geladen.naechste_fahrstrasse() == 4
+    with pytest.raises(ValueError):
+        geladen.fahrplan_fs_idx[1] = 9
@@ -0,0 +1,70 @@
+# tests/test_zug_store.py
+
+import pytest
+
+from src.rail_stores import ZugSicht, ZugStore
+from src.rail_types import IdRegistry, OrtTyp, Zug, ZugStatus
+
+
+def _zuege(anzahl: int, **zustand) -> ZugStore:
+    ids = IdRegistry()
+    return ZugStore(
+        [Zug(ids.intern(f'zug_{i}'), 'RB', 100.0, 40.0, 1.0, 1.0, **Zug.fahrplan_spalten([]), **zustand)
+         for i in range(anzahl)],
+        ids,
+    )
+
+
+def test_zug_ort_als_drei_felder():
+    zug = Zug(0, 'RB', 100.0, 40.0, 1.0, 1.0, **Zug.fahrplan_spalten([]))
+    assert (zug.ort_typ, zug.ort_idx, zug.ort_offset) == (OrtTyp.KNOTEN, 0, 0.0)
+
+
+def test_zug_sicht_liefert_den_ort():
+    zuege = _zuege(2, status=ZugStatus.FAHREND, aktuelle_geschwindigkeit=10.0,
+                   ort_typ=OrtTyp.ABSCHNITT, ort_idx=7, ort_offset=520.5)
+
+    assert zuege[1] == ZugSicht(zug_id=1, status=ZugStatus.FAHREND, geschwindigkeit=10.0,
+                                ort_typ=OrtTyp.ABSCHNITT, ort_idx=7, ort_offset=520.5)
+    assert isinstance(zuege[1].ort_typ, OrtTyp)
+
+    # Der Schritt schreibt den Fortschritt im Element fort, Art und Index bleiben.
+    zuege.schritt(2.0)
+    assert zuege[0].ort_offset == pytest.approx(540.5)
+    assert (zuege[0].ort_typ, zuege[0].ort_idx) == (OrtTyp.ABSCHNITT, 7)
+
+
+def test_spalten_pro_zug_ueber_mehrere_bloecke():
+    zuege = _zuege(11, status=ZugStatus.FAHREND, aktuelle_geschwindigkeit=10.0)
+    zuege.spalte_setzen('geschwindigkeit', [0, 9], [4.0, 6.0])
+
+    assert zuege.bloecke.shape == (2,)
+    assert len(zuege) == 11
+    assert zuege.geschwindigkeit.shape == (11,)
+    assert zuege.geschwindigkeit[9] == 6.0
+    assert zuege[9].geschwindigkeit == 6.0
+    assert zuege.geschwindigkeit.tolist() == [4.0] + [10.0] * 8 + [6.0, 10.0]
+    with pytest.raises(ValueError):
+        zuege.geschwindigkeit[0] = 1.0
+    with pytest.raises(IndexError):
+        zuege.spalte_setzen('status', [11], ZugStatus.BREMSEND)
+
+
+def test_freie_spuren_bleiben_unveraendert():
+    zuege = _zuege(11, status=ZugStatus.BESCHLEUNIGEND)
+    zuege.schritt(1.0)
+
+    # Spuren 3..7 des zweiten Blocks gehören zu keinem Zug.
+    frei = zuege.bloecke[1]
+    assert frei['geschwindigkeit'][3:].tolist() == [0.0] * 5
+    assert frei['ort_offset'][3:].tolist() == [0.0] * 5
+    assert frei['status'][3:].tolist() == [ZugStatus.STEHEND] * 5
+    assert zuege.geschwindigkeit.tolist() == [1.0] * 11
+
+
+def test_mit_status_ohne_freie_spuren():
+    zuege = _zuege(11, status=ZugStatus.FAHREND)
+    zuege.spalte_setzen('status', [2, 10], ZugStatus.STEHEND)
+
+    assert zuege.mit_status(ZugStatus.STEHEND).tolist() == [2, 10]
+    assert len(zuege.mit_status(ZugStatus.FAHREND)) == 9